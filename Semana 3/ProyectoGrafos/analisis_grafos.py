@@ -1,10 +1,20 @@
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, TextIO, Tuple, Union
+import csv
+import heapq
 import os
+import sys
 
-def load_graph(file_path: str, is_directed: bool = True) -> Dict[str, List[Tuple[str, float]]]:
+from carga_grafos import CompactGraph, GraphIndex, load_graph_cached, print_parse_report
+
+# Lista de adyacencia o grafo en columnas; las funciones de análisis aceptan ambos
+Graph = Union[Dict[str, List[Tuple[str, float]]], CompactGraph]
+
+def load_graph(file_path: str, is_directed: bool = True) -> GraphIndex:
     """
     Carga un grafo desde un archivo de texto con manejo robusto de errores.
+    Devuelve un GraphIndex: se usa como el diccionario de adyacencia de
+    siempre, pero el grado de entrada se consulta en O(1).
     """
     adjacency_list = defaultdict(list)
     
@@ -47,56 +57,187 @@ def load_graph(file_path: str, is_directed: bool = True) -> Dict[str, List[Tuple
     except Exception as e:
         print(f"❌ Error inesperado al leer '{file_path}': {e}")
     
-    return dict(adjacency_list)
+    return GraphIndex(adjacency_list)
+
+def load_graph_fast(file_path: str, is_directed: bool = True) -> Graph:
+    """
+    Carga un grafo usando la caché binaria (file_path + '.gcache'): sólo
+    interpreta el texto la primera vez o cuando el archivo cambia.
+    Devuelve el CompactGraph tal cual, sin construir la lista de adyacencia;
+    analyze_graph lo recorre directamente.
+    """
+    if not os.path.exists(file_path):
+        print(f"❌ Error: El archivo '{file_path}' no existe.")
+        return GraphIndex()
+    
+    graph, report = load_graph_cached(file_path, is_directed)
+    print_parse_report(report)
+    return graph
 
-def get_neighbors(graph: Dict[str, List[Tuple[str, float]]], vertex: str) -> List[Tuple[str, float]]:
-    """Obtiene la lista de vecinos de un vértice."""
+def get_neighbors(graph: Graph, vertex: str) -> List[Tuple[str, float]]:
+    """Obtiene la lista de vecinos de un vértice (O(E) con un CompactGraph)."""
+    if isinstance(graph, CompactGraph):
+        return graph.neighbors([vertex]).get(vertex, [])
     return graph.get(vertex, [])
 
-def get_out_degree(graph: Dict[str, List[Tuple[str, float]]], vertex: str) -> int:
+def get_out_degree(graph: Graph, vertex: str) -> int:
     """Calcula el grado de salida de un vértice."""
+    if isinstance(graph, CompactGraph):
+        i = graph.ids.get(vertex)
+        return graph.degrees()[0][i] if i is not None else 0
     return len(graph.get(vertex, []))
 
-def get_in_degree(graph: Dict[str, List[Tuple[str, float]]], vertex: str) -> int:
-    """Calcula el grado de entrada de un vértice."""
+def get_in_degree(graph: Graph, vertex: str) -> int:
+    """Calcula el grado de entrada de un vértice (O(1) con GraphIndex o CompactGraph)."""
+    if isinstance(graph, CompactGraph):
+        i = graph.ids.get(vertex)
+        return graph.degrees()[1][i] if i is not None else 0
+    if isinstance(graph, GraphIndex):
+        j = graph.ids.get(vertex)
+        return graph.in_degree[j] if j is not None else 0
+    
     in_degree = 0
     for neighbors in graph.values():
         in_degree += sum(1 for neighbor, _ in neighbors if neighbor == vertex)
     return in_degree
 
-def analyze_graph(graph: Dict[str, List[Tuple[str, float]]], graph_type: str):
-    """Analiza y muestra estadísticas detalladas del grafo."""
-    print(f"\n{'='*50}")
-    print(f" Analisis del Grafo {graph_type}")
-    print(f"{'='*50}")
+# Líneas del reporte acumuladas antes de escribirlas de una vez
+REPORT_FLUSH_LINES = 4096
+
+SORT_KEYS = ('name', 'out', 'in', 'total')
+
+def get_vertices(graph: Graph) -> List[str]:
+    """Vértices con lista de adyacencia (con aristas de salida), ordenados por nombre."""
+    if isinstance(graph, CompactGraph):
+        return sorted(graph.vertices())
+    return sorted(graph.keys())
+
+def export_degrees_csv(graph: Graph, file_path: str):
+    """
+    Exporta el grado de entrada y salida de cada vértice a un CSV con
+    columnas vertex, out_degree, in_degree (ordenado por nombre).
+    """
+    with open(file_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['vertex', 'out_degree', 'in_degree'])
+        writer.writerows((vertex, get_out_degree(graph, vertex), get_in_degree(graph, vertex))
+                         for vertex in get_vertices(graph))
+
+def analyze_graph(graph: Graph, graph_type: str,
+                  top: Optional[int] = None, sort_by: str = 'name', page: int = 1,
+                  page_size: Optional[int] = None, csv_path: Optional[str] = None,
+                  stream: Optional[TextIO] = None):
+    """
+    Analiza y muestra estadísticas detalladas del grafo.
+    El reporte se acumula y se escribe por bloques en lugar de con un
+    print por línea; la cadena de vecinos sólo se construye para los
+    vértices que se muestran.
     
-    if not graph:
-        print("  El grafo esta vacio")
-        return
+    Args:
+        graph: Lista de adyacencia (idealmente un GraphIndex) o CompactGraph
+        graph_type: Descripción del grafo para el título
+        top: Mostrar sólo los primeros top vértices según sort_by
+        sort_by: Orden del detalle: 'name', 'out', 'in' o 'total' (grado)
+        page: Página del detalle a mostrar (desde 1)
+        page_size: Vértices por página (por defecto, todos)
+        csv_path: Si se indica, exporta los grados de todos los vértices a CSV
+        stream: Destino del reporte (por defecto, la salida estándar)
     
-    vertices = sorted(graph.keys())
-    total_edges = sum(len(neighbors) for neighbors in graph.values())
+    Raises:
+        ValueError: Si sort_by no es válido, page_size < 1 o page está
+                    fuera de 1..número de páginas
+    """
+    if sort_by not in SORT_KEYS:
+        raise ValueError(f"sort_by debe ser uno de {SORT_KEYS}")
+    if page_size is not None and page_size < 1:
+        raise ValueError("page_size debe ser al menos 1")
+    if page < 1:
+        raise ValueError("page debe ser al menos 1")
+    out = stream or sys.stdout
+    lines: List[str] = []
     
-    print(f" Estadisticas generales:")
-    print(f"   - Vertices: {len(vertices)}")
-    print(f"   - Aristas: {total_edges}")
+    def emit(line: str = ""):
+        lines.append(line)
+        if len(lines) >= REPORT_FLUSH_LINES:
+            out.write("\n".join(lines) + "\n")
+            lines.clear()
     
-    # Calcular densidad (para grafos dirigidos)
-    max_possible_edges = len(vertices) * (len(vertices) - 1)
-    if max_possible_edges > 0:
-        density = total_edges / max_possible_edges
-        print(f"   - Densidad: {density:.3f}")
+    emit(f"\n{'='*50}")
+    emit(f" Analisis del Grafo {graph_type}")
+    emit(f"{'='*50}")
     
-    print(f"\n Detalles por vertice:")
-    for vertex in vertices:
-        out_deg = get_out_degree(graph, vertex)
-        in_deg = get_in_degree(graph, vertex)
-        neighbors = get_neighbors(graph, vertex)
+    vertices = get_vertices(graph)
+    if not vertices:
+        emit("  El grafo esta vacio")
+    else:
+        if isinstance(graph, CompactGraph):
+            # Grados leídos de las columnas sin pasar por get_*_degree en cada vértice
+            ids = graph.ids
+            out_column, in_column = graph.degrees()
+            out_degree = lambda v: out_column[ids[v]]
+            in_degree = lambda v: in_column[ids[v]]
+            total_edges = graph.num_edges * (1 if graph.is_directed else 2)
+        else:
+            out_degree = lambda v: get_out_degree(graph, v)
+            in_degree = lambda v: get_in_degree(graph, v)
+            total_edges = sum(len(neighbors) for neighbors in graph.values())
+        
+        emit(f" Estadisticas generales:")
+        emit(f"   - Vertices: {len(vertices)}")
+        emit(f"   - Aristas: {total_edges}")
         
-        neighbor_str = ", ".join([f"{neighbor}({weight:.1f}km)" for neighbor, weight in neighbors])
+        # Calcular densidad (para grafos dirigidos)
+        max_possible_edges = len(vertices) * (len(vertices) - 1)
+        if max_possible_edges > 0:
+            density = total_edges / max_possible_edges
+            emit(f"   - Densidad: {density:.3f}")
         
-        print(f"   {vertex}: Out-degree={out_deg}, In-degree={in_deg}")
-        print(f"      - Vecinos: [{neighbor_str}]")
+        # Vértices a mostrar: orden, filtro top y página
+        if sort_by != 'name':
+            degree = {
+                'out': out_degree,
+                'in': in_degree,
+                'total': lambda v: out_degree(v) + in_degree(v),
+            }[sort_by]
+            if top is not None:
+                vertices = heapq.nlargest(top, vertices, key=degree)  # Empates por nombre
+            else:
+                vertices.sort(key=degree, reverse=True)
+        elif top is not None:
+            vertices = vertices[:top]
+        total_shown = len(vertices)
+        pages = max(1, -(-total_shown // page_size)) if page_size is not None else 1
+        if page > pages:
+            raise ValueError(f"page debe estar entre 1 y {pages}")
+        if page_size is not None:
+            vertices = vertices[(page - 1) * page_size:page * page_size]
+        
+        if csv_path:
+            export_degrees_csv(graph, csv_path)
+            emit(f"   - Grados exportados a '{csv_path}'")
+        
+        # Un CompactGraph junta los vecinos de todos los vértices mostrados en una pasada
+        if isinstance(graph, CompactGraph):
+            shown_neighbors = graph.neighbors(vertices)
+        else:
+            shown_neighbors = {vertex: get_neighbors(graph, vertex) for vertex in vertices}
+        
+        emit(f"\n Detalles por vertice:")
+        for vertex in vertices:
+            out_deg = out_degree(vertex)
+            in_deg = in_degree(vertex)
+            neighbors = shown_neighbors[vertex]
+            
+            neighbor_str = ", ".join([f"{neighbor}({weight:.1f}km)" for neighbor, weight in neighbors])
+            
+            emit(f"   {vertex}: Out-degree={out_deg}, In-degree={in_deg}")
+            emit(f"      - Vecinos: [{neighbor_str}]")
+        
+        if page_size is not None:
+            emit(f"\n   Pagina {page} de {pages} ({total_shown} vertices)")
+    
+    out.write("\n".join(lines) + "\n")
+    out.flush()
 
 def main():
     print(" === Analisis de Grafos en Python === ")
@@ -104,11 +245,11 @@ def main():
     # Analizar Grafo No Dirigido (cargado como dirigido para ver estructura cruda, o como no dirigido si el archivo solo tiene una dirección)
     # Nota: El archivo exportado por C# para no dirigido ya tiene las aristas deduplicadas (solo una dirección).
     # Por lo tanto, debemos cargarlo con is_directed=False para reconstruir las aristas inversas en memoria.
-    undirected_graph = load_graph("edges_undirected.txt", is_directed=False)
+    undirected_graph = load_graph_fast("edges_undirected.txt", is_directed=False)
     analyze_graph(undirected_graph, "No Dirigido (Calles Bidireccionales)")
     
     # Analizar Grafo Dirigido
-    directed_graph = load_graph("edges_directed.txt", is_directed=True)
+    directed_graph = load_graph_fast("edges_directed.txt", is_directed=True)
     analyze_graph(directed_graph, "Dirigido (Mapa Completo)")
 
 if __name__ == "__main__":
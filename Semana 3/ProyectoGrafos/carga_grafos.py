@@ -0,0 +1,471 @@
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+# Tamaño mínimo de bloque por proceso: con archivos pequeños no conviene paralelizar
+MIN_CHUNK_BYTES = 4 << 20
+
+# Ejemplos de líneas inválidas que se conservan por tipo de error
+MAX_EXAMPLES = 5
+
+ERROR_MISSING_VERTEX = 'faltan_vertices'
+ERROR_BAD_WEIGHT = 'peso_invalido'
+
+# Caché binaria: encabezado fijo seguido de nombres, reporte y columnas alineadas a 8 bytes
+CACHE_SUFFIX = '.gcache'
+CACHE_MAGIC = b'GCACHE01'
+# magic, tamaño y mtime (ns) del origen, sha256 del origen, vértices, aristas,
+# bytes de nombres, bytes del reporte
+_CACHE_HEADER = struct.Struct('<8sqq32sqqqq')
+
+
+class GraphIndex(dict):
+    """
+    Lista de adyacencia (vértice -> [(vecino, peso)]) con índices precalculados:
+    adyacencia inversa y arreglos de grado de entrada y salida por vértice.
+    Se construye una vez al cargar el grafo; si se modifica la lista de
+    adyacencia hay que llamar a reindex().
+    """
+    
+    def __init__(self, adjacency: Dict[str, List[Tuple[str, float]]] = None):
+        super().__init__(adjacency or {})
+        self.reindex()
+    
+    def reindex(self):
+        """Recalcula los índices en O(V + E)."""
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        
+        def intern(vertex):
+            if vertex not in self.ids:
+                self.ids[vertex] = len(self.names)
+                self.names.append(vertex)
+            return self.ids[vertex]
+        
+        for vertex in self:
+            intern(vertex)
+        for neighbors in self.values():
+            for neighbor, _ in neighbors:
+                intern(neighbor)
+        
+        n = len(self.names)
+        self.out_degree = array('i', [0]) * n
+        self.in_degree = array('i', [0]) * n
+        self.reverse: List[List[Tuple[str, float]]] = [[] for _ in range(n)]
+        
+        for vertex, neighbors in self.items():
+            self.out_degree[self.ids[vertex]] = len(neighbors)
+            for neighbor, weight in neighbors:
+                j = self.ids[neighbor]
+                self.in_degree[j] += 1
+                self.reverse[j].append((vertex, weight))
+    
+    def predecessors(self, vertex: str) -> List[Tuple[str, float]]:
+        """Vértices con una arista hacia vertex, con su peso."""
+        j = self.ids.get(vertex)
+        return self.reverse[j] if j is not None else []
+
+
+class CompactGraph:
+    """
+    Grafo en arreglos compactos: los vértices se internan a ids enteros
+    densos (names[id] es el nombre) y cada arista ocupa una posición en
+    src, dst y weight. Un grafo no dirigido guarda cada arista una sola vez.
+    analyze_graph y las consultas de grado lo usan directamente, sin
+    convertirlo a lista de adyacencia.
+    """
+
+    def __init__(self, names: List[str], src: array, dst: array, weight: array,
+                 is_directed: bool = True, buffer: Optional[mmap.mmap] = None):
+        self.names = names
+        self.src = src
+        self.dst = dst
+        self.weight = weight
+        self.is_directed = is_directed
+        self._buffer = buffer  # Mapeo de la caché del que salen las columnas
+        self._ids: Optional[Dict[str, int]] = None
+        self._degrees: Optional[Tuple[array, array]] = None
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.names)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.src)
+
+    @property
+    def ids(self) -> Dict[str, int]:
+        """Nombre -> id (se construye la primera vez que se usa)."""
+        if self._ids is None:
+            self._ids = {name: i for i, name in enumerate(self.names)}
+        return self._ids
+
+    def degrees(self) -> Tuple[array, array]:
+        """
+        Grados de salida y de entrada por id, contados sobre las columnas.
+        En un grafo no dirigido ambos cuentan las dos puntas de cada arista,
+        igual que la lista de adyacencia de load_graph.
+        """
+        if self._degrees is None:
+            n = self.num_vertices
+            if self.is_directed:
+                out_degree = array('i', map(Counter(self.src).__getitem__, range(n)))
+                in_degree = array('i', map(Counter(self.dst).__getitem__, range(n)))
+            else:
+                out_degree = in_degree = array('i', map(Counter(chain(self.src, self.dst)).__getitem__, range(n)))
+            self._degrees = (out_degree, in_degree)
+        return self._degrees
+
+    def vertices(self) -> List[str]:
+        """Vértices con aristas de salida: las claves que tendría la lista de adyacencia."""
+        out_degree, _ = self.degrees()
+        return [name for name, d in zip(self.names, out_degree) if d]
+
+    def neighbors(self, vertices: List[str]) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        Vecinos (con peso) de los vértices pedidos, en el orden del archivo.
+        Hace una sola pasada por las aristas sin importar cuántos se pidan.
+        """
+        ids = self.ids
+        names = self.names
+        # Lista por id (None = no pedido): indexar es más rápido que buscar en un dict
+        wanted: List[Optional[List[Tuple[str, float]]]] = [None] * self.num_vertices
+        result: Dict[str, List[Tuple[str, float]]] = {}
+        for vertex in vertices:
+            i = ids.get(vertex)
+            if i is not None and wanted[i] is None:
+                wanted[i] = result[vertex] = []
+
+        if not result:
+            return result
+        if self.is_directed:
+            for u, v, w in zip(self.src, self.dst, self.weight):
+                found = wanted[u]
+                if found is not None:
+                    found.append((names[v], w))
+        else:
+            for u, v, w in zip(self.src, self.dst, self.weight):
+                found = wanted[u]
+                if found is not None:
+                    found.append((names[v], w))
+                found = wanted[v]
+                if found is not None:
+                    found.append((names[u], w))
+        return result
+
+    def to_graph_index(self) -> GraphIndex:
+        """Convierte a la lista de adyacencia que usa analyze_graph."""
+        names = self.names
+        adjacency: Dict[str, List[Tuple[str, float]]] = {}
+        for u, v, w in zip(self.src, self.dst, self.weight):
+            adjacency.setdefault(names[u], []).append((names[v], w))
+            if not self.is_directed:
+                adjacency.setdefault(names[v], []).append((names[u], w))
+        return GraphIndex(adjacency)
+
+
+def _chunk_bounds(mm, size: int, chunks: int) -> List[Tuple[int, int]]:
+    """Divide [0, size) en bloques que terminan justo después de un salto de línea."""
+    bounds = []
+    start = 0
+    for i in range(1, chunks):
+        cut = mm.find(b'\n', max(start, size * i // chunks))
+        if cut == -1:
+            break
+        bounds.append((start, cut + 1))
+        start = cut + 1
+    if start < size:
+        bounds.append((start, size))
+    return bounds
+
+
+def _parse_chunk(task: Tuple[str, int, int]):
+    """
+    Tarea de un proceso: interpreta las líneas de file_path[start:end].
+
+    Returns:
+        Tupla (nombres locales, src, dst, pesos, líneas, errores, ejemplos)
+        donde src/dst usan ids locales al bloque y los ejemplos llevan el
+        número de línea relativo al bloque
+    """
+    file_path, start, end = task
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[start:end]
+
+    ids: Dict[bytes, int] = {}
+    src = array('i')
+    dst = array('i')
+    weight = array('d')
+    errors = {ERROR_MISSING_VERTEX: 0, ERROR_BAD_WEIGHT: 0}
+    examples: Dict[str, List[Tuple[int, str]]] = {ERROR_MISSING_VERTEX: [], ERROR_BAD_WEIGHT: []}
+
+    def report(kind, line_num, line):
+        errors[kind] += 1
+        if len(examples[kind]) < MAX_EXAMPLES:
+            examples[kind].append((line_num, line.decode('utf-8', 'replace')))
+
+    lines = data.split(b'\n')
+    if lines and not lines[-1]:
+        lines.pop()  # El bloque termina en salto de línea
+    for line_num, line in enumerate(lines, 1):
+        parts = line.split()
+        if not parts or parts[0].startswith(b'#'):
+            continue
+        if len(parts) < 2:
+            report(ERROR_MISSING_VERTEX, line_num, line.strip())
+            continue
+
+        w = 1.0
+        if len(parts) > 2:
+            try:
+                w = float(parts[2])
+            except ValueError:
+                report(ERROR_BAD_WEIGHT, line_num, line.strip())
+
+        u = ids.setdefault(parts[0], len(ids))
+        v = ids.setdefault(parts[1], len(ids))
+        src.append(u)
+        dst.append(v)
+        weight.append(w)
+
+    names = [name.decode('utf-8') for name in ids]
+    return names, src, dst, weight, len(lines), errors, examples
+
+
+def load_graph_parallel(file_path: str, is_directed: bool = True,
+                        workers: Optional[int] = None) -> Tuple[CompactGraph, Dict]:
+    """
+    Carga un archivo de aristas "origen destino [peso]" en un CompactGraph.
+    Mapea el archivo en memoria, lo divide en bloques alineados a saltos de
+    línea y los interpreta en un pool de procesos; luego une los vértices
+    de cada bloque en un único espacio de ids. Las líneas inválidas se
+    cuentan por tipo en lugar de imprimirse una a una.
+
+    Args:
+        file_path: Ruta del archivo de aristas
+        is_directed: Si el grafo es dirigido
+        workers: Número de procesos (por defecto, número de CPUs)
+
+    Returns:
+        Tupla (grafo, reporte) donde reporte es un diccionario con 'lines',
+        'edges', 'errors' (tipo -> cantidad) y 'examples' (tipo -> lista de
+        (número de línea, texto))
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    size = os.path.getsize(file_path)
+    chunks = max(1, min(workers, size // MIN_CHUNK_BYTES))
+    if size == 0:
+        bounds = []
+    else:
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            bounds = _chunk_bounds(mm, size, chunks)
+
+    tasks = [(file_path, start, end) for start, end in bounds]
+    if len(tasks) > 1:
+        with ProcessPoolExecutor(min(workers, len(tasks))) as pool:
+            parts = list(pool.map(_parse_chunk, tasks))
+    else:
+        parts = [_parse_chunk(task) for task in tasks]
+
+    # Unir los ids locales de cada bloque en ids globales
+    ids: Dict[str, int] = {}
+    names: List[str] = []
+    src = array('i')
+    dst = array('i')
+    weight = array('d')
+    report = {
+        'lines': 0,
+        'edges': 0,
+        'errors': {ERROR_MISSING_VERTEX: 0, ERROR_BAD_WEIGHT: 0},
+        'examples': {ERROR_MISSING_VERTEX: [], ERROR_BAD_WEIGHT: []},
+    }
+
+    for local_names, local_src, local_dst, local_w, lines, errors, examples in parts:
+        mapping = array('i', [0]) * len(local_names)
+        for i, name in enumerate(local_names):
+            gid = ids.get(name)
+            if gid is None:
+                gid = ids[name] = len(names)
+                names.append(name)
+            mapping[i] = gid
+
+        src.extend(mapping[u] for u in local_src)
+        dst.extend(mapping[v] for v in local_dst)
+        weight.extend(local_w)
+
+        for kind, count in errors.items():
+            report['errors'][kind] += count
+            room = MAX_EXAMPLES - len(report['examples'][kind])
+            report['examples'][kind].extend(
+                (report['lines'] + line_num, text) for line_num, text in examples[kind][:room]
+            )
+        report['lines'] += lines
+
+    report['edges'] = len(src)
+    return CompactGraph(names, src, dst, weight, is_directed), report
+
+
+def print_parse_report(report: Dict):
+    """Muestra un resumen de las líneas inválidas de una carga."""
+    total = sum(report['errors'].values())
+    if not total:
+        return
+
+    labels = {ERROR_MISSING_VERTEX: "faltan vértices (ignoradas)",
+              ERROR_BAD_WEIGHT: "peso inválido (se usó 1.0)"}
+    print(f"⚠️  {total} líneas con problemas de {report['lines']}:")
+    for kind, count in report['errors'].items():
+        if count:
+            print(f"   - {count} con {labels[kind]}")
+            for line_num, text in report['examples'][kind]:
+                print(f"      Línea {line_num}: '{text}'")
+
+
+def _file_sha256(file_path: str) -> bytes:
+    """Hash SHA-256 del contenido de un archivo, leído por bloques."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def _pad8(n: int) -> int:
+    return -n % 8
+
+
+def write_graph_cache(graph: CompactGraph, report: Dict, file_path: str, cache_path: str):
+    """
+    Guarda un grafo interpretado en una caché binaria asociada a file_path.
+    Se escribe en un archivo temporal y se renombra, así que un corte a
+    mitad de escritura nunca deja una caché a medias.
+    """
+    stat = os.stat(file_path)
+    names_blob = '\n'.join(graph.names).encode('utf-8')
+    report_blob = json.dumps(report, ensure_ascii=False).encode('utf-8')
+    header = _CACHE_HEADER.pack(CACHE_MAGIC, stat.st_size, stat.st_mtime_ns, _file_sha256(file_path),
+                                graph.num_vertices, graph.num_edges, len(names_blob), len(report_blob))
+
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        for blob in (header, names_blob, report_blob):
+            f.write(blob)
+            f.write(b'\0' * _pad8(len(blob)))
+        for column in (graph.src, graph.dst, graph.weight):
+            f.write(bytes(column))
+            f.write(b'\0' * _pad8(len(column) * column.itemsize))
+    os.replace(tmp_path, cache_path)
+
+
+def _cache_size(names_len: int, report_len: int, m: int) -> int:
+    """Tamaño exacto de una caché según los largos de su encabezado."""
+    total = 0
+    for length in (_CACHE_HEADER.size, names_len, report_len, m * 4, m * 4, m * 8):
+        total += length + _pad8(length)
+    return total
+
+
+def read_graph_cache(file_path: str, cache_path: str,
+                     is_directed: bool = True) -> Optional[Tuple[CompactGraph, Dict]]:
+    """
+    Carga una caché binaria si sigue correspondiendo a file_path.
+    Si tamaño y mtime coinciden se usa sin más; si sólo cambió el mtime se
+    compara el hash del contenido (y se actualiza el mtime guardado). Las
+    columnas src, dst y weight son vistas sobre el archivo mapeado en
+    memoria, sin copiarlas. Una caché truncada o con largos que no cuadran
+    con su encabezado se descarta.
+
+    Returns:
+        Tupla (grafo, reporte), o None si no hay caché válida
+    """
+    if not os.path.exists(cache_path):
+        return None
+
+    with open(cache_path, 'r+b') as f:
+        head = f.read(_CACHE_HEADER.size)
+        if len(head) < _CACHE_HEADER.size:
+            return None
+        magic, size, mtime_ns, digest, n, m, names_len, report_len = _CACHE_HEADER.unpack(head)
+        stat = os.stat(file_path)
+        if magic != CACHE_MAGIC or size != stat.st_size:
+            return None
+        if min(n, m, names_len, report_len) < 0:
+            return None
+        if os.fstat(f.fileno()).st_size != _cache_size(names_len, report_len, m):
+            return None
+        if mtime_ns != stat.st_mtime_ns:
+            if digest != _file_sha256(file_path):
+                return None
+            # Mismo contenido con otro mtime (por ejemplo, tras copiarlo)
+            f.seek(0)
+            f.write(_CACHE_HEADER.pack(magic, size, stat.st_mtime_ns, digest, n, m, names_len, report_len))
+            f.flush()
+
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(buffer)
+    pos = _CACHE_HEADER.size + _pad8(_CACHE_HEADER.size)
+    names_blob = bytes(view[pos:pos + names_len])
+    names = names_blob.decode('utf-8').split('\n') if n else []
+    if len(names) != n:
+        view.release()
+        buffer.close()
+        return None
+    pos += names_len + _pad8(names_len)
+    report = json.loads(bytes(view[pos:pos + report_len]))
+    report['examples'] = {kind: [tuple(ex) for ex in found] for kind, found in report['examples'].items()}
+    pos += report_len + _pad8(report_len)
+
+    columns = []
+    for fmt, itemsize in (('i', 4), ('i', 4), ('d', 8)):
+        columns.append(view[pos:pos + m * itemsize].cast(fmt))
+        pos += m * itemsize + _pad8(m * itemsize)
+
+    return CompactGraph(names, *columns, is_directed=is_directed, buffer=buffer), report
+
+
+def load_graph_cached(file_path: str, is_directed: bool = True,
+                      workers: Optional[int] = None) -> Tuple[CompactGraph, Dict]:
+    """
+    Carga un archivo de aristas usando una caché binaria junto al origen
+    (file_path + '.gcache'). Si la caché falta o no corresponde al archivo
+    actual, lo interpreta con load_graph_parallel y la regenera.
+
+    Args:
+        file_path: Ruta del archivo de aristas
+        is_directed: Si el grafo es dirigido
+        workers: Número de procesos para interpretar el archivo
+
+    Returns:
+        Tupla (grafo, reporte) como load_graph_parallel
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+    """
+    cache_path = file_path + CACHE_SUFFIX
+    try:
+        cached = read_graph_cache(file_path, cache_path, is_directed)
+    except (OSError, ValueError, struct.error):
+        cached = None  # Caché corrupta: se regenera
+    if cached is not None:
+        return cached
+
+    graph, report = load_graph_parallel(file_path, is_directed, workers)
+    try:
+        write_graph_cache(graph, report, file_path, cache_path)
+    except OSError:
+        pass  # Sin permiso de escritura: se usa el grafo sin caché
+    return graph, report
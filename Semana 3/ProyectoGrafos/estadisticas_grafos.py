@@ -0,0 +1,194 @@
+from array import array
+from collections import Counter
+from typing import Dict, Optional
+import argparse
+import hashlib
+import heapq
+import math
+
+from carga_grafos import ERROR_BAD_WEIGHT, ERROR_MISSING_VERTEX
+
+
+class HyperLogLog:
+    """
+    Estimador de elementos distintos con memoria fija (2^precision bytes).
+    El error relativo típico es 1.04 / sqrt(2^precision): con la precisión
+    por defecto (14) ocupa 16 KB y se equivoca en torno a un 0.8%.
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision debe estar entre 4 y 18")
+        self.p = precision
+        self.m = 1 << precision
+        self.registers = bytearray(self.m)
+
+    def add(self, item: bytes):
+        """Registra un elemento."""
+        h = int.from_bytes(hashlib.blake2b(item, digest_size=8).digest(), 'little')
+        idx = h & (self.m - 1)
+        rest = h >> self.p
+        # Posición del primer bit en 1 de los 64 - p bits restantes
+        rank = (64 - self.p) - rest.bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def estimate(self) -> float:
+        """Número estimado de elementos distintos."""
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)  # Conteo lineal para cardinalidades bajas
+        return raw
+
+
+def stream_graph_stats(file_path: str, is_directed: bool = True, degrees: bool = True,
+                       hll: bool = False, top_k: int = 10, hll_precision: int = 14) -> Dict:
+    """
+    Calcula estadísticas de un archivo de aristas "origen destino [peso]" en
+    una sola pasada, sin construir la lista de adyacencia: la memoria no
+    depende del número de aristas.
+
+    Args:
+        file_path: Ruta del archivo de aristas
+        is_directed: Si el grafo es dirigido (si no, cada línea suma grado a
+                     ambos extremos y cuenta como dos aristas, como en
+                     analyze_graph)
+        degrees: Si se cuentan grados por vértice (memoria O(V)); sin ellos
+                 no hay histograma ni top-k y los vértices se estiman con
+                 HyperLogLog
+        hll: Si se estima el número de vértices con HyperLogLog
+        top_k: Cantidad de vértices de mayor grado a reportar
+        hll_precision: Precisión del HyperLogLog
+
+    Returns:
+        Diccionario con 'vertices', 'vertices_estimated', 'edges', 'density',
+        'weight' (min, max, mean), 'errors', y con degrees: 'out_histogram',
+        'in_histogram' (grado -> vértices) y 'top_out', 'top_in' (listas de
+        (grado, vértice))
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+    """
+    use_hll = hll or not degrees
+    sketch = HyperLogLog(hll_precision) if use_hll else None
+    ids: Dict[bytes, int] = {}
+    out_deg = array('q')
+    in_deg = array('q')
+    edges = 0
+    w_min, w_max, w_sum = math.inf, -math.inf, 0.0
+    errors = {ERROR_MISSING_VERTEX: 0, ERROR_BAD_WEIGHT: 0}
+
+    def vertex_id(name: bytes) -> int:
+        vid = ids.get(name)
+        if vid is None:
+            vid = ids[name] = len(out_deg)
+            out_deg.append(0)
+            in_deg.append(0)
+        return vid
+
+    with open(file_path, 'rb') as f:
+        for line in f:
+            parts = line.split()
+            if not parts or parts[0].startswith(b'#'):
+                continue
+            if len(parts) < 2:
+                errors[ERROR_MISSING_VERTEX] += 1
+                continue
+
+            w = 1.0
+            if len(parts) > 2:
+                try:
+                    w = float(parts[2])
+                except ValueError:
+                    errors[ERROR_BAD_WEIGHT] += 1
+
+            u, v = parts[0], parts[1]
+            edges += 1 if is_directed else 2
+            w_min = min(w_min, w)
+            w_max = max(w_max, w)
+            w_sum += w
+
+            if sketch is not None:
+                sketch.add(u)
+                sketch.add(v)
+            if degrees:
+                ui, vi = vertex_id(u), vertex_id(v)
+                out_deg[ui] += 1
+                in_deg[vi] += 1
+                if not is_directed:
+                    out_deg[vi] += 1
+                    in_deg[ui] += 1
+
+    vertices = round(sketch.estimate()) if use_hll else len(ids)
+
+    stats = {
+        'vertices': vertices,
+        'vertices_estimated': use_hll,
+        'edges': edges,
+        'density': edges / (vertices * (vertices - 1)) if vertices > 1 else 0.0,
+        'weight': {
+            'min': w_min if edges else None,
+            'max': w_max if edges else None,
+            'mean': w_sum / (edges if is_directed else edges // 2) if edges else None,
+        },
+        'errors': errors,
+    }
+
+    if degrees:
+        names = list(ids)
+        # nlargest mantiene un heap de tamaño top_k: O(V log k)
+        stats['out_histogram'] = dict(sorted(Counter(out_deg).items()))
+        stats['in_histogram'] = dict(sorted(Counter(in_deg).items()))
+        # Con empates, nlargest conserva el orden de aparición en el archivo
+        for key, deg in (('top_out', out_deg), ('top_in', in_deg)):
+            top = heapq.nlargest(top_k, range(len(names)), key=deg.__getitem__)
+            stats[key] = [(deg[i], names[i].decode('utf-8')) for i in top]
+
+    return stats
+
+
+def print_stream_stats(stats: Dict, title: Optional[str] = None):
+    """Muestra las estadísticas calculadas por stream_graph_stats."""
+    print(f"\n{'='*50}")
+    print(f" Estadisticas del Grafo {title or ''}".rstrip())
+    print(f"{'='*50}")
+    approx = " (estimado)" if stats['vertices_estimated'] else ""
+    print(f"   - Vertices: {stats['vertices']}{approx}")
+    print(f"   - Aristas: {stats['edges']}")
+    print(f"   - Densidad: {stats['density']:.3g}")
+    weight = stats['weight']
+    if weight['mean'] is not None:
+        print(f"   - Peso: min={weight['min']:.1f}, max={weight['max']:.1f}, promedio={weight['mean']:.2f}")
+
+    bad = sum(stats['errors'].values())
+    if bad:
+        print(f"   ⚠️  {bad} líneas inválidas")
+
+    if 'top_out' in stats:
+        for label, key, hist in (("salida", 'top_out', 'out_histogram'),
+                                 ("entrada", 'top_in', 'in_histogram')):
+            top = ", ".join(f"{name}({deg})" for deg, name in stats[key])
+            print(f"\n Mayor grado de {label}: {top}")
+            print(f"   Histograma (grado: vertices): "
+                  + ", ".join(f"{deg}: {count}" for deg, count in stats[hist].items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estadísticas de un archivo de aristas en una pasada")
+    parser.add_argument('file', help="Archivo de aristas 'origen destino [peso]'")
+    parser.add_argument('--undirected', action='store_true', help="Tratar el grafo como no dirigido")
+    parser.add_argument('--hll', action='store_true', help="Estimar vértices con HyperLogLog")
+    parser.add_argument('--no-degrees', action='store_true',
+                        help="No contar grados por vértice (memoria constante)")
+    parser.add_argument('--top', type=int, default=10, help="Vértices de mayor grado a mostrar")
+    args = parser.parse_args()
+
+    stats = stream_graph_stats(args.file, not args.undirected, not args.no_degrees,
+                               args.hll, args.top)
+    print_stream_stats(stats, args.file)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import pytest
+import io
+import re
+from analisis_grafos import analyze_graph, get_in_degree, get_out_degree, load_graph, load_graph_fast
+
+def _graph(tmp_path):
+    lines = ["a b 1.0", "a c 2.0", "a d 3.0", "b c 1.5", "c a 2.5", "d c 1.0", "e c 4.0", "e a 1.0"]
+    path = tmp_path / "aristas.txt"
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return str(path)
+
+def _report(graph, **kwargs):
+    out = io.StringIO()
+    analyze_graph(graph, "prueba", stream=out, **kwargs)
+    return out.getvalue()
+
+def _shown(report):
+    return re.findall(r"^   (\w+): Out-degree", report, re.MULTILINE)
+
+def test_top_by_degree(tmp_path):
+    """Test top-N ordenado por grado, con empates por nombre."""
+    graph = load_graph(_graph(tmp_path))
+
+    assert _shown(_report(graph, top=2, sort_by='in')) == ['c', 'a']
+    assert _shown(_report(graph, top=3, sort_by='out')) == ['a', 'e', 'b']
+    assert _shown(_report(graph, top=2)) == ['a', 'b']
+
+def test_paging(tmp_path):
+    """Test páginas consecutivas cubren todos los vértices sin repetir."""
+    graph = load_graph(_graph(tmp_path))
+
+    first = _report(graph, page=1, page_size=2)
+    last = _report(graph, page=3, page_size=2)
+
+    assert _shown(first) == ['a', 'b']
+    assert _shown(_report(graph, page=2, page_size=2)) == ['c', 'd']
+    assert _shown(last) == ['e']
+    assert "Pagina 1 de 3 (5 vertices)" in first
+    assert "Pagina 2 de 2 (3 vertices)" in _report(graph, top=3, sort_by='total', page=2, page_size=2)
+
+@pytest.mark.parametrize("kwargs", [
+    {'page': 0},
+    {'page': 4, 'page_size': 2},
+    {'page': 2},
+    {'page_size': 0},
+    {'sort_by': 'peso'},
+])
+def test_invalid_page_arguments(tmp_path, kwargs):
+    """Test página, tamaño de página u orden inválidos."""
+    graph = load_graph(_graph(tmp_path))
+
+    with pytest.raises(ValueError):
+        _report(graph, **kwargs)
+
+def test_invalid_page_writes_no_csv(tmp_path):
+    """Test una página inválida falla antes de exportar el CSV."""
+    graph = load_graph(_graph(tmp_path))
+    csv_path = tmp_path / "grados.csv"
+
+    with pytest.raises(ValueError):
+        _report(graph, page=9, page_size=2, csv_path=str(csv_path))
+
+    assert not csv_path.exists()
+
+@pytest.mark.parametrize("is_directed", [True, False])
+def test_cached_graph_report_matches(tmp_path, is_directed):
+    """Test el grafo de la caché produce el mismo reporte y grados que load_graph."""
+    path = _graph(tmp_path)
+    graph = load_graph(path, is_directed)
+    load_graph_fast(path, is_directed)
+    cached = load_graph_fast(path, is_directed)
+
+    assert _report(cached) == _report(graph)
+    assert _report(cached, top=2, sort_by='total', page=2, page_size=1) == \
+        _report(graph, top=2, sort_by='total', page=2, page_size=1)
+    for vertex in "abcdez":
+        assert get_out_degree(cached, vertex) == get_out_degree(graph, vertex)
+        assert get_in_degree(cached, vertex) == get_in_degree(graph, vertex)
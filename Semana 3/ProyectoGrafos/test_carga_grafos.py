@@ -0,0 +1,162 @@
+import pytest
+import os
+import random
+import carga_grafos
+from carga_grafos import (_CACHE_HEADER, CACHE_SUFFIX, ERROR_BAD_WEIGHT, ERROR_MISSING_VERTEX, load_graph_cached,
+                          load_graph_parallel, read_graph_cache)
+from analisis_grafos import load_graph
+
+def _write_edges(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return str(path)
+
+def _random_lines(count, seed=0):
+    """Aristas aleatorias con comentarios, líneas vacías y líneas inválidas."""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        r = rng.random()
+        if r < 0.03:
+            lines.append("# comentario")
+        elif r < 0.05:
+            lines.append("")
+        elif r < 0.07:
+            lines.append(f"solo{i}")
+        elif r < 0.09:
+            lines.append(f"v{rng.randrange(50)} v{rng.randrange(50)} x{i}")
+        else:
+            lines.append(f"v{rng.randrange(50)} v{rng.randrange(50)} {rng.randint(1, 99) / 10}")
+    return lines
+
+def test_chunk_bounds_end_at_newlines():
+    """Test los bloques cubren el archivo y terminan justo tras un salto de línea."""
+    data = b"".join(f"a{i} b{i} {i}\n".encode() for i in range(200))
+
+    for chunks in (1, 2, 3, 7, 50):
+        bounds = carga_grafos._chunk_bounds(data, len(data), chunks)
+
+        assert bounds[0][0] == 0 and bounds[-1][1] == len(data)
+        assert all(end == start for (_, end), (start, _) in zip(bounds, bounds[1:]))
+        assert all(data[end - 1:end] == b"\n" for _, end in bounds)
+
+def test_chunk_bounds_without_final_newline():
+    """Test el último bloque llega al final aunque no haya salto de línea."""
+    data = b"a b 1\nc d 2\ne f 3"
+
+    bounds = carga_grafos._chunk_bounds(data, len(data), 3)
+
+    assert bounds[-1][1] == len(data)
+    assert b"".join(data[s:e] for s, e in bounds) == data
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_parallel_matches_load_graph(tmp_path, monkeypatch, capsys, workers):
+    """Test mismo grafo que load_graph con varios procesos y bloques pequeños."""
+    monkeypatch.setattr(carga_grafos, "MIN_CHUNK_BYTES", 64)
+    path = _write_edges(tmp_path / "aristas.txt", _random_lines(400))
+
+    for is_directed in (True, False):
+        graph, report = load_graph_parallel(path, is_directed, workers)
+        expected = load_graph(path, is_directed)
+
+        assert dict(graph.to_graph_index()) == dict(expected)
+        assert report['lines'] == 400
+        assert report['edges'] == graph.num_edges
+    capsys.readouterr()
+
+def test_error_examples_use_global_line_numbers(tmp_path, monkeypatch):
+    """Test los ejemplos de error llevan el número de línea del archivo, no del bloque."""
+    monkeypatch.setattr(carga_grafos, "MIN_CHUNK_BYTES", 32)
+    lines = [f"a{i} b{i} 1.0" for i in range(60)]
+    lines[5] = "huerfano"
+    lines[31] = "a b peso"
+    lines[57] = "otro"
+    path = _write_edges(tmp_path / "aristas.txt", lines)
+
+    graph, report = load_graph_parallel(path, workers=3)
+
+    assert report['errors'] == {ERROR_MISSING_VERTEX: 2, ERROR_BAD_WEIGHT: 1}
+    assert report['examples'][ERROR_MISSING_VERTEX] == [(6, "huerfano"), (58, "otro")]
+    assert report['examples'][ERROR_BAD_WEIGHT] == [(32, "a b peso")]
+    assert graph.num_edges == 58
+
+def test_empty_file(tmp_path):
+    """Test archivo vacío: grafo sin vértices ni aristas."""
+    path = tmp_path / "vacio.txt"
+    path.write_bytes(b"")
+
+    graph, report = load_graph_parallel(str(path))
+
+    assert graph.num_vertices == 0 and graph.num_edges == 0
+    assert report['lines'] == 0
+
+def _forbid_parsing(monkeypatch):
+    """Hace fallar cualquier intento de volver a interpretar el texto."""
+    def fail(*args, **kwargs):
+        raise AssertionError("se volvió a interpretar el archivo")
+    monkeypatch.setattr(carga_grafos, "load_graph_parallel", fail)
+
+def test_cache_hit(tmp_path, monkeypatch):
+    """Test segunda carga: sale de la caché con el mismo grafo y reporte."""
+    path = _write_edges(tmp_path / "aristas.txt", _random_lines(300))
+    graph, report = load_graph_cached(path, is_directed=False)
+    _forbid_parsing(monkeypatch)
+
+    cached, cached_report = load_graph_cached(path, is_directed=False)
+
+    assert cached.names == graph.names
+    assert list(cached.src) == list(graph.src) and list(cached.dst) == list(graph.dst)
+    assert list(cached.weight) == list(graph.weight)
+    assert cached_report == report
+    assert dict(cached.to_graph_index()) == dict(graph.to_graph_index())
+
+def test_cache_mtime_only_change(tmp_path, monkeypatch):
+    """Test sólo cambia el mtime: el hash coincide y se actualiza el mtime guardado."""
+    path = _write_edges(tmp_path / "aristas.txt", _random_lines(100))
+    load_graph_cached(path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    _forbid_parsing(monkeypatch)
+
+    graph, _ = load_graph_cached(path)
+
+    cache = tmp_path / ("aristas.txt" + CACHE_SUFFIX)
+    stored_mtime = _CACHE_HEADER.unpack(cache.read_bytes()[:_CACHE_HEADER.size])[2]
+    assert stored_mtime == os.stat(path).st_mtime_ns
+    assert graph.num_edges > 0
+
+def test_cache_content_change(tmp_path):
+    """Test cambia el contenido (mismo tamaño): la caché no se usa y se regenera."""
+    path = _write_edges(tmp_path / "aristas.txt", ["a b 1.0", "b c 2.0"])
+    load_graph_cached(path)
+    stat = os.stat(path)
+    _write_edges(tmp_path / "aristas.txt", ["a b 1.0", "b d 2.0"])
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))  # Otro mtime: se compara el hash
+
+    graph, _ = load_graph_cached(path)
+
+    assert graph.names == ['a', 'b', 'd']
+    assert read_graph_cache(path, path + CACHE_SUFFIX)[0].names == ['a', 'b', 'd']
+
+@pytest.mark.parametrize("cut", [3, 16, 200, 2000])
+def test_truncated_cache_is_rebuilt(tmp_path, cut):
+    """Test caché truncada: se descarta y se regenera con columnas completas."""
+    path = _write_edges(tmp_path / "aristas.txt", _random_lines(300))
+    graph, _ = load_graph_cached(path)
+    cache = tmp_path / ("aristas.txt" + CACHE_SUFFIX)
+    cache.write_bytes(cache.read_bytes()[:-cut])
+
+    assert read_graph_cache(path, str(cache)) is None
+
+    again, _ = load_graph_cached(path)
+
+    assert len(again.src) == len(again.dst) == len(again.weight) == graph.num_edges
+    assert read_graph_cache(path, str(cache)) is not None
+
+def test_cache_with_extra_bytes_is_rejected(tmp_path):
+    """Test caché con bytes de más: los largos no cuadran con el encabezado."""
+    path = _write_edges(tmp_path / "aristas.txt", _random_lines(100))
+    load_graph_cached(path)
+    cache = tmp_path / ("aristas.txt" + CACHE_SUFFIX)
+    cache.write_bytes(cache.read_bytes() + b"\0" * 8)
+
+    assert read_graph_cache(path, str(cache)) is None
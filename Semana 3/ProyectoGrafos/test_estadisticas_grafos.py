@@ -0,0 +1,78 @@
+import pytest
+import io
+import random
+import re
+from collections import Counter
+from analisis_grafos import analyze_graph, load_graph
+from carga_grafos import ERROR_BAD_WEIGHT, ERROR_MISSING_VERTEX
+from estadisticas_grafos import HyperLogLog, stream_graph_stats
+
+def _edge_file(tmp_path):
+    rng = random.Random(4)
+    lines = ["# red de prueba", ""]
+    for _ in range(300):
+        lines.append(f"v{rng.randrange(40)} v{rng.randrange(40)} {rng.randint(1, 50) / 10}")
+    lines += ["suelto", "v1 v2 abc"]
+    path = tmp_path / "aristas.txt"
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return str(path)
+
+@pytest.mark.parametrize("is_directed", [True, False])
+def test_stats_match_load_graph(tmp_path, capsys, is_directed):
+    """Test conteos e histogramas iguales a los de load_graph y analyze_graph."""
+    path = _edge_file(tmp_path)
+    graph = load_graph(path, is_directed)
+    report = io.StringIO()
+    analyze_graph(graph, "prueba", stream=report)
+    capsys.readouterr()
+
+    stats = stream_graph_stats(path, is_directed)
+
+    assert stats['vertices'] == len(graph.names)
+    assert not stats['vertices_estimated']
+    assert stats['edges'] == int(re.search(r"Aristas: (\d+)", report.getvalue()).group(1))
+    assert stats['out_histogram'] == dict(sorted(Counter(graph.out_degree).items()))
+    assert stats['in_histogram'] == dict(sorted(Counter(graph.in_degree).items()))
+    assert stats['errors'] == {ERROR_MISSING_VERTEX: 1, ERROR_BAD_WEIGHT: 1}
+
+    assert [d for d, _ in stats['top_out']] == sorted(graph.out_degree, reverse=True)[:10]
+
+def test_stats_weights(tmp_path):
+    """Test mínimo, máximo y promedio de pesos (un peso inválido cuenta como 1.0)."""
+    path = tmp_path / "aristas.txt"
+    path.write_text("a b 2.0\nb c 4.0\nc a x\n", encoding='utf-8')
+
+    stats = stream_graph_stats(str(path), is_directed=False)
+
+    assert stats['weight'] == {'min': 1.0, 'max': 4.0, 'mean': pytest.approx(7.0 / 3)}
+    assert stats['edges'] == 6
+
+def test_stats_without_degrees_uses_hll(tmp_path):
+    """Test sin grados: vértices estimados con HyperLogLog y sin histogramas."""
+    path = _edge_file(tmp_path)
+
+    stats = stream_graph_stats(path, degrees=False)
+
+    assert stats['vertices_estimated']
+    assert stats['vertices'] == pytest.approx(40, abs=2)
+    assert 'out_histogram' not in stats
+
+@pytest.mark.parametrize("count", [100, 5000, 200000])
+def test_hyperloglog_error_bound(count):
+    """Test error relativo del estimador dentro de 4 desviaciones (1.04 / sqrt(m))."""
+    hll = HyperLogLog(14)
+    for i in range(count):
+        hll.add(f"vertice{i}".encode())
+    for i in range(0, count, 3):
+        hll.add(f"vertice{i}".encode())  # Repetidos no cuentan
+
+    bound = 4 * 1.04 / (hll.m ** 0.5)
+
+    assert abs(hll.estimate() - count) / count <= bound
+
+def test_hyperloglog_precision_range():
+    """Test precisión fuera de rango."""
+    with pytest.raises(ValueError):
+        HyperLogLog(3)
+    with pytest.raises(ValueError):
+        HyperLogLog(19)
@@ -0,0 +1,175 @@
+import pytest
+import itertools
+import random
+from pathlib import Path
+from array import array
+import validacion_grafos
+from validacion_grafos import (are_graphical_sequences, extract_directed_degree_pairs, find_asymmetric_edges,
+                               is_digraphical_sequence, is_graphical_erdos_gallai,
+                               is_graphical_sequence, realize_degree_sequence,
+                               validate_symmetric_consistency, write_edge_list)
+
+WEEK3_DIR = Path(__file__).resolve().parents[2] / "Semana 3" / "ProyectoGrafos"
+
+def test_erdos_gallai_matches_havel_hakimi():
+    """Test Erdos-Gallai coincide con Havel-Hakimi en toda secuencia de hasta 8 vértices."""
+    for n in range(9):
+        for degrees in itertools.combinations_with_replacement(range(n + 1), n):
+            seq = list(degrees)
+            assert is_graphical_erdos_gallai(seq) == is_graphical_sequence(seq), seq
+
+def test_erdos_gallai_ignores_order_and_rejects_negatives():
+    """Test el orden de entrada no importa y los grados negativos se rechazan."""
+    assert is_graphical_erdos_gallai([1, 3, 2, 2])
+    assert is_graphical_erdos_gallai([1, 1, 1, 1, 1, 1, 6])
+    assert not is_graphical_erdos_gallai([2, -1, 1])
+    assert is_graphical_erdos_gallai([])
+
+def _random_sequences(count, seed=0):
+    rng = random.Random(seed)
+    return [[rng.randint(0, 6) for _ in range(rng.randint(0, 8))] for _ in range(count)]
+
+def test_batch_ragged_sequences():
+    """Test lote con secuencias de distinto largo y tipo (lista, tupla, array)."""
+    seqs = _random_sequences(300)
+    mixed = [tuple(seq) if i % 3 == 1 else array('i', seq) if i % 3 == 2 else seq
+             for i, seq in enumerate(seqs)]
+
+    result = are_graphical_sequences(mixed, workers=1)
+
+    assert result == [is_graphical_sequence(seq) for seq in seqs]
+
+def test_batch_zero_padded_rows():
+    """Test filas de una matriz rellenas con ceros: mismo resultado que sin relleno."""
+    seqs = _random_sequences(300, seed=1)
+    width = max(len(seq) for seq in seqs)
+    matrix = [seq + [0] * (width - len(seq)) for seq in seqs]
+
+    assert are_graphical_sequences(matrix, workers=1) == are_graphical_sequences(seqs, workers=1)
+
+def test_batch_process_pool(monkeypatch):
+    """Test camino con pool de procesos: mismo orden y resultado que en serie."""
+    monkeypatch.setattr(validacion_grafos, "BATCH_MIN_PARALLEL_DEGREES", 0)
+    seqs = _random_sequences(500, seed=2)
+
+    result = are_graphical_sequences(seqs, workers=2, chunk_size=64)
+
+    assert result == [is_graphical_erdos_gallai(seq) for seq in seqs]
+    assert are_graphical_sequences([], workers=2) == []
+
+def _check_realization(degrees, edges):
+    realized = [0] * len(degrees)
+    seen = set()
+    for u, v in edges:
+        assert u != v  # Sin lazos
+        key = (min(u, v), max(u, v))
+        assert key not in seen  # Sin aristas repetidas
+        seen.add(key)
+        realized[u] += 1
+        realized[v] += 1
+    assert realized == degrees
+
+def test_realization_matches_degrees():
+    """Test la realización es un grafo simple con exactamente los grados pedidos."""
+    rng = random.Random(5)
+    for n in range(9):
+        # Todos los órdenes hasta 6 vértices; para 7 y 8, cada multiconjunto desordenado
+        if n <= 6:
+            sequences = itertools.product(range(n), repeat=n)
+        else:
+            sequences = (rng.sample(c, n) for c in itertools.combinations_with_replacement(range(n), n))
+        for degrees in sequences:
+            seq = list(degrees)
+            if is_graphical_sequence(seq):
+                _check_realization(seq, realize_degree_sequence(seq))
+
+    big = [rng.randint(1, 30) for _ in range(2000)]
+    big[0] += sum(big) % 2
+    _check_realization(big, realize_degree_sequence(big))
+
+@pytest.mark.parametrize("degrees", [[3, 3, 3, 1], [5, 3, 2, 2, 1], [3, 2, 1], [1, -1], [2, 2, 0, 0]])
+def test_realization_rejects_non_graphical(degrees):
+    """Test secuencias no gráficas lanzan ValueError."""
+    with pytest.raises(ValueError):
+        realize_degree_sequence(degrees)
+
+def test_edge_list_round_trip(tmp_path, monkeypatch, capsys):
+    """Test el archivo escrito se carga con load_graph (Semana 3) y conserva los grados."""
+    monkeypatch.syspath_prepend(str(WEEK3_DIR))
+    from analisis_grafos import load_graph
+    degrees = [4, 3, 3, 2, 2, 2, 1, 1, 0]
+    names = [f"n{i}" for i in range(len(degrees))]
+    path = tmp_path / "realizado.txt"
+
+    write_edge_list(realize_degree_sequence(degrees), str(path), names, weight=2.5, batch_size=3)
+    graph = load_graph(str(path), is_directed=False)
+
+    assert capsys.readouterr().out == ""  # Ninguna línea inválida
+    assert {v: len(nbrs) for v, nbrs in graph.items()} == {n: d for n, d in zip(names, degrees) if d}
+    assert all(w == 2.5 for nbrs in graph.values() for _, w in nbrs)
+
+def test_symmetric_graph_is_consistent():
+    """Test grafo no dirigido correcto, con aristas paralelas y un lazo."""
+    graph = {
+        'A': [('B', 2.0), ('B', 2.0), ('C', 1.0), ('A', 5.0), ('A', 5.0)],
+        'B': [('A', 2.0), ('A', 2.0)],
+        'C': [('A', 1.0)],
+    }
+
+    assert find_asymmetric_edges(graph) == []
+    assert validate_symmetric_consistency(graph)
+
+def test_parallel_edges_matched_one_to_one():
+    """Test dos aristas paralelas con una sola inversa: sobra una."""
+    graph = {'A': [('B', 2.0), ('B', 2.0)], 'B': [('A', 2.0)]}
+
+    assert find_asymmetric_edges(graph) == [('A', 'B', 2.0)]
+
+def test_self_loop_needs_both_entries():
+    """Test un lazo guardado una sola vez (load_graph lo guarda dos veces)."""
+    graph = {'A': [('A', 1.0), ('B', 1.0)], 'B': [('A', 1.0)]}
+
+    assert find_asymmetric_edges(graph) == [('A', 'A', 1.0)]
+
+def test_weight_mismatch_and_missing_reverse():
+    """Test inversa con otro peso e inversa ausente se reportan juntas."""
+    graph = {
+        'A': [('B', 2.0), ('C', 1.0)],
+        'B': [('A', 3.0)],
+        'C': [('A', 1.0)],
+        'D': [('A', 4.0)],
+    }
+
+    assert sorted(find_asymmetric_edges(graph)) == [('A', 'B', 2.0), ('B', 'A', 3.0), ('D', 'A', 4.0)]
+    assert not validate_symmetric_consistency(graph)
+
+def _realizable_pairs(n):
+    """Pares (entrada, salida) de todos los digrafos simples etiquetados de n vértices."""
+    arcs = [(u, v) for u in range(n) for v in range(n) if u != v]
+    found = set()
+    for mask in range(1 << len(arcs)):
+        d_in = [0] * n
+        d_out = [0] * n
+        for bit, (u, v) in enumerate(arcs):
+            if mask >> bit & 1:
+                d_out[u] += 1
+                d_in[v] += 1
+        found.add(tuple(zip(d_in, d_out)))
+    return found
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 4])
+def test_digraphical_matches_brute_force(n):
+    """Test Fulkerson-Chen-Anstee contra todos los digrafos de hasta 4 vértices."""
+    realizable = _realizable_pairs(n)
+
+    for pairs in itertools.product(itertools.product(range(n + 1), repeat=2), repeat=n):
+        assert is_digraphical_sequence(list(pairs)) == (pairs in realizable), pairs
+
+def test_directed_degree_pairs_from_adjacency():
+    """Test pares de un grafo dirigido, incluidos los vértices que sólo son destino."""
+    graph = {'A': [('B', 1.0), ('C', 1.0)], 'B': [('C', 1.0)], 'C': [('D', 2.0)]}
+
+    pairs = extract_directed_degree_pairs(graph)
+
+    assert pairs == [(0, 2), (1, 1), (2, 1), (1, 0)]
+    assert is_digraphical_sequence(pairs)
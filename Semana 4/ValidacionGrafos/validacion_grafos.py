@@ -1,4 +1,10 @@
-from typing import List, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from typing import List, Dict, Optional, Sequence, Tuple
+import os
+
+# Below this many degrees in total, a process pool costs more than it saves
+BATCH_MIN_PARALLEL_DEGREES = 200000
 
 def is_graphical_sequence(degrees: List[int]) -> bool:
     """
@@ -36,6 +42,211 @@ def is_graphical_sequence(degrees: List[int]) -> bool:
     
     return True
 
+def is_graphical_erdos_gallai(degrees: List[int]) -> bool:
+    """
+    Validates graphical sequence using the Erdos-Gallai inequalities.
+    Degrees are bounded by n - 1, so a counting sort orders them in O(n);
+    the right-hand side of each inequality is then read from prefix sums
+    with a pointer that only moves backwards. Complexity: O(n).
+    """
+    n = len(degrees)
+    if n == 0:
+        return True
+
+    counts = [0] * n
+    total_sum = 0
+    for d in degrees:
+        if d < 0 or d >= n:
+            return False
+        counts[d] += 1
+        total_sum += d
+    if total_sum % 2 != 0:
+        return False
+
+    # Counting sort in non-increasing order
+    seq = []
+    for d in range(n - 1, -1, -1):
+        seq.extend([d] * counts[d])
+    prefix = [0, *accumulate(seq)]
+
+    # For each k: sum(d_1..d_k) <= k(k-1) + sum_{i>k} min(d_i, k)
+    j = n  # Number of degrees >= k
+    for k in range(1, n + 1):
+        if seq[k - 1] == 0:
+            break  # Left side stops growing, right side does not shrink
+        while j > 0 and seq[j - 1] < k:
+            j -= 1
+        m = max(j, k)
+        # Degrees after k that are >= k contribute k each, the rest themselves
+        if prefix[k] > k * (k - 1) + k * (m - k) + (total_sum - prefix[m]):
+            return False
+
+    return True
+
+def is_digraphical_sequence(degree_pairs: List[Tuple[int, int]]) -> bool:
+    """
+    Validates (in-degree, out-degree) pairs of a simple directed graph using
+    the Fulkerson-Chen-Anstee inequalities. With pairs sorted by out-degree
+    (then in-degree) in non-increasing order, for every k:
+    sum_{i<=k} out_i <= sum_{i<=k} min(in_i, k-1) + sum_{i>k} min(in_i, k).
+    The right side is sum_i min(in_i, k) minus the first k in-degrees that
+    are >= k, counted with a Fenwick tree. Complexity: O(n log n).
+    """
+    n = len(degree_pairs)
+    if n == 0:
+        return True
+    if any(not (0 <= d_in < n and 0 <= d_out < n) for d_in, d_out in degree_pairs):
+        return False
+    if sum(d_in for d_in, _ in degree_pairs) != sum(d_out for _, d_out in degree_pairs):
+        return False
+
+    pairs = sorted(((d_out, d_in) for d_in, d_out in degree_pairs), reverse=True)
+
+    # at_least[k] = number of in-degrees >= k
+    at_least = [0] * (n + 1)
+    for _, d_in in pairs:
+        at_least[d_in] += 1
+    for k in range(n - 1, -1, -1):
+        at_least[k] += at_least[k + 1]
+
+    tree = [0] * (n + 1)  # Fenwick tree over in-degree values 0..n-1 (index + 1)
+    out_sum = 0
+    min_sum = 0  # sum_i min(in_i, k)
+    for k in range(1, n + 1):
+        d_out, d_in = pairs[k - 1]
+        out_sum += d_out
+        min_sum += at_least[k]
+
+        i = d_in + 1
+        while i <= n:
+            tree[i] += 1
+            i += i & -i
+
+        # Among the first k in-degrees, how many are >= k
+        below = 0
+        i = k  # Values 0..k-1 occupy indices 1..k
+        while i > 0:
+            below += tree[i]
+            i -= i & -i
+        if out_sum > min_sum - (k - below):
+            return False
+
+    return True
+
+def _check_batch(sequences: List[Sequence[int]]) -> List[bool]:
+    return [is_graphical_erdos_gallai(seq) for seq in sequences]
+
+def are_graphical_sequences(sequences: Sequence[Sequence[int]], workers: Optional[int] = None,
+                            chunk_size: int = 1000) -> List[bool]:
+    """
+    Validates many degree sequences at once with the O(n) Erdos-Gallai check.
+    Sequences may have different lengths, or be rows of a matrix padded
+    with zeros: isolated vertices never change the answer.
+    Large batches are split into chunks of chunk_size sequences and
+    evaluated by a process pool.
+
+    Args:
+        sequences: Degree sequences (lists, tuples, arrays or matrix rows)
+        workers: Number of processes (None = os.cpu_count(), 1 = serial)
+        chunk_size: Sequences sent to each process per task
+
+    Returns:
+        One boolean per sequence, in input order
+    """
+    sequences = [list(seq) for seq in sequences]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    total_degrees = sum(len(seq) for seq in sequences)
+    if workers <= 1 or len(sequences) <= chunk_size or total_degrees < BATCH_MIN_PARALLEL_DEGREES:
+        return _check_batch(sequences)
+
+    chunks = [sequences[i:i + chunk_size] for i in range(0, len(sequences), chunk_size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_check_batch, chunks):
+            results.extend(part)
+    return results
+
+def realize_degree_sequence(degrees: List[int]) -> List[Tuple[int, int]]:
+    """
+    Builds a simple graph with the given degree sequence (Havel-Hakimi).
+    Vertices are kept in buckets indexed by residual degree instead of
+    re-sorting: the vertex of maximum degree d is connected to the d
+    vertices of highest residual degree, found by walking at most d
+    buckets down. Complexity: O(n + m).
+
+    Args:
+        degrees: Degree of each vertex (vertex i has degrees[i])
+
+    Returns:
+        Edge list [(u, v), ...] with vertices numbered 0..n-1
+
+    Raises:
+        ValueError: If the sequence is not graphical
+    """
+    n = len(degrees)
+    if any(d < 0 or d >= n for d in degrees) or sum(degrees) % 2 != 0:
+        raise ValueError("Degree sequence is not graphical")
+
+    buckets: List[List[int]] = [[] for _ in range(n)]
+    for v, d in enumerate(degrees):
+        if d > 0:
+            buckets[d].append(v)
+    residual = list(degrees)
+    edges = []
+    top = n - 1
+
+    while True:
+        while top > 0 and not buckets[top]:
+            top -= 1
+        if top <= 0:
+            break
+
+        v = buckets[top].pop()
+        d = residual[v]
+        residual[v] = 0
+
+        # Take the d highest residual degrees; levels visited are at most d
+        picked = []
+        level = top
+        while len(picked) < d:
+            if level == 0:
+                raise ValueError("Degree sequence is not graphical")
+            bucket = buckets[level]
+            while bucket and len(picked) < d:
+                picked.append(bucket.pop())
+            level -= 1
+
+        # Move them one bucket down only after picking, so none is taken twice
+        for u in picked:
+            edges.append((v, u))
+            residual[u] -= 1
+            if residual[u] > 0:
+                buckets[residual[u]].append(u)
+
+    return edges
+
+def write_edge_list(edges: List[Tuple[int, int]], file_path: str,
+                    names: Optional[Sequence[str]] = None, weight: Optional[float] = None,
+                    batch_size: int = 10000):
+    """
+    Writes edges as "origin destination [weight]" lines, the format read by
+    load_graph (Week 3). Each undirected edge is written once, so load it
+    with is_directed=False. Vertices of degree 0 do not appear in the file.
+
+    Args:
+        edges: Edge list, e.g. from realize_degree_sequence
+        file_path: Output file
+        names: Vertex names (default: the vertex number)
+        weight: Weight written on every edge (default: none, read as 1.0)
+        batch_size: Lines buffered per write call
+    """
+    label = names.__getitem__ if names is not None else str
+    suffix = f" {weight}\n" if weight is not None else "\n"
+    with open(file_path, 'w', encoding='utf-8') as f:
+        for i in range(0, len(edges), batch_size):
+            f.writelines(f"{label(u)} {label(v)}{suffix}" for u, v in edges[i:i + batch_size])
+
 def validate_consistency(adjacency_list: Dict[str, List[Tuple[str, float]]]) -> bool:
     """
     Verifies consistency: sum of degrees must be even in undirected graph.
@@ -44,6 +255,55 @@ def validate_consistency(adjacency_list: Dict[str, List[Tuple[str, float]]]) ->
     # In undirected graph, sum of degrees = 2 * |edges|
     return total_degree % 2 == 0
 
+def find_asymmetric_edges(adjacency_list: Dict[str, List[Tuple[str, float]]]) -> List[Tuple[str, str, float]]:
+    """
+    Finds edges of an undirected adjacency list that have no reverse edge
+    with the same weight. Edges cancel against their reverse in a hash map
+    as they are read, so only unmatched ones are kept. Complexity: O(E).
+    Parallel edges must be matched one to one, and a self-loop needs its
+    two entries (as load_graph stores it).
+
+    Returns:
+        Unmatched edges (origin, destination, weight), one per missing reverse
+    """
+    pending: Dict[Tuple[str, str, float], int] = {}
+    for u, neighbors in adjacency_list.items():
+        for v, w in neighbors:
+            reverse = (v, u, w)
+            count = pending.get(reverse)
+            if count:
+                if count == 1:
+                    del pending[reverse]
+                else:
+                    pending[reverse] = count - 1
+            else:
+                edge = (u, v, w)
+                pending[edge] = pending.get(edge, 0) + 1
+
+    offending = []
+    for edge, count in pending.items():
+        offending.extend([edge] * count)
+    return offending
+
+def validate_symmetric_consistency(adjacency_list: Dict[str, List[Tuple[str, float]]]) -> bool:
+    """
+    Verifies that every edge of an undirected graph has its reverse with
+    the same weight (stronger than validate_consistency). Complexity: O(E).
+    """
+    return not find_asymmetric_edges(adjacency_list)
+
+def extract_directed_degree_pairs(adjacency_list: Dict[str, List[Tuple[str, float]]]) -> List[Tuple[int, int]]:
+    """
+    Extracts (in-degree, out-degree) pairs from a directed graph, such as
+    the ones loaded by load_graph in Week 3. Vertices that only appear as
+    destinations are included with out-degree 0.
+    """
+    in_degree: Dict[str, int] = {u: 0 for u in adjacency_list}
+    for neighbors in adjacency_list.values():
+        for v, _ in neighbors:
+            in_degree[v] = in_degree.get(v, 0) + 1
+    return [(d_in, len(adjacency_list.get(v, ()))) for v, d_in in in_degree.items()]
+
 def extract_degree_sequence(adjacency_list: Dict[str, List[Tuple[str, float]]]) -> List[int]:
     """
     Extracts degree sequence from a graph.
@@ -73,18 +333,27 @@ def main():
     passed = 0
     for i, (seq, expected, reason) in enumerate(test_cases, 1):
         result = is_graphical_sequence(seq)
-        status = "PASS" if result == expected else "FAIL"
+        result_eg = is_graphical_erdos_gallai(seq)
+        ok = result == expected and result_eg == expected
+        status = "PASS" if ok else "FAIL"
         
-        if result == expected:
+        if ok:
             passed += 1
         
         print(f"Caso {i}: {seq}")
         print(f"  Esperado: {'Grafica' if expected else 'No Grafica'}")
         print(f"  Resultado: {'Grafica' if result else 'No Grafica'} [{status}]")
+        print(f"  Erdos-Gallai: {'Grafica' if result_eg else 'No Grafica'}")
         print(f"  Razon: {reason}\n")
     
     print(f"Resultado: {passed}/{len(test_cases)} casos pasados\n")
     
+    batch = are_graphical_sequences([seq for seq, _, _ in test_cases])
+    print(f"Validacion por lotes: {sum(batch)}/{len(batch)} secuencias graficas\n")
+    
+    realized = realize_degree_sequence([3, 2, 2, 1])
+    print(f"Realizacion de [3, 2, 2, 1]: {realized}\n")
+    
     # Validate city map from Week 3
     print("=== Validacion del Mapa Urbano (Semana 3) ===\n")
     
@@ -107,6 +376,15 @@ def main():
     print(f"Secuencia extraida: {extracted_seq}")
     print(f"Es grafica? {'Si' if is_graphical else 'No'}")
     print(f"Es consistente (suma par)? {'Si' if is_consistent else 'No'}")
+    print(f"Es simetrico (cada arista con su inversa)? {'Si' if validate_symmetric_consistency(city_graph) else 'No'}")
+    
+    broken_graph = {'A': [('B', 2.0)], 'B': [('A', 3.0), ('C', 1.0)], 'C': [('B', 1.0)], 'D': [('A', 1.0)]}
+    print(f"Aristas sin inversa en un grafo roto: {find_asymmetric_edges(broken_graph)}")
+    
+    directed_graph = {'A': [('B', 1.0), ('C', 1.0)], 'B': [('C', 1.0)], 'C': [('A', 1.0)]}
+    pairs = extract_directed_degree_pairs(directed_graph)
+    print(f"Pares (entrada, salida) del grafo dirigido: {pairs}")
+    print(f"Es digrafica? {'Si' if is_digraphical_sequence(pairs) else 'No'}")
     
     print("\n=== Proyecto completado exitosamente! ===")
 
@@ -1,5 +1,6 @@
+from array import array
 from collections import deque, defaultdict
-from typing import List, Dict, Set
+from typing import List, Dict, Tuple
 from enum import Enum
 
 class NodeState(Enum):
@@ -10,17 +11,50 @@ class NodeState(Enum):
 class GraphTraversal:
     def __init__(self):
         self.adjacency_list = defaultdict(list)
+        self._csr = None  # (names, ids, offsets, targets), built by freeze()
     
     def add_edge(self, u: str, v: str):
         """Add undirected edge"""
         self.adjacency_list[u].append(v)
         self.adjacency_list[v].append(u)
+        self._csr = None
     
     def add_directed_edge(self, u: str, v: str):
         """Add directed edge"""
         self.adjacency_list[u].append(v)
         if v not in self.adjacency_list:
             self.adjacency_list[v] = []
+        self._csr = None
+    
+    def freeze(self) -> Tuple[List[str], Dict[str, int], array, array]:
+        """
+        Build a CSR adjacency: node names interned to ints in sorted-name
+        order, neighbors of node i in targets[offsets[i]:offsets[i + 1]],
+        sorted once. Since ids follow name order, sorted ids visit nodes in
+        the same order as sorted names. add_edge/add_directed_edge discard
+        it; traversals rebuild it when needed.
+        """
+        names = set(self.adjacency_list)
+        for neighbors in self.adjacency_list.values():
+            names.update(neighbors)
+        names = sorted(names)
+        ids = {name: i for i, name in enumerate(names)}
+        
+        offsets = array('q', [0])
+        targets = array('q')
+        intern = ids.__getitem__
+        get = self.adjacency_list.get
+        for name in names:
+            neighbors = get(name)
+            if neighbors:
+                targets.extend(sorted(map(intern, neighbors)))
+            offsets.append(len(targets))
+        
+        self._csr = (names, ids, offsets, targets)
+        return self._csr
+    
+    def _frozen(self) -> Tuple[List[str], Dict[str, int], array, array]:
+        return self._csr if self._csr is not None else self.freeze()
     
     # ========================================
     # BUSQUEDA EN AMPLITUD (BFS)
@@ -31,24 +65,24 @@ class GraphTraversal:
         if start not in self.adjacency_list:
             raise ValueError(f"El nodo {start} no existe en el grafo")
         
-        visited = set()
+        names, ids, offsets, targets = self._frozen()
+        visited = bytearray(len(names))
         result = []
         queue = deque()
         
-        queue.append(start)
-        visited.add(start)
+        queue.append(ids[start])
+        visited[ids[start]] = 1
         
         while queue:
             current = queue.popleft()
             result.append(current)
             
-            if current in self.adjacency_list:
-                for neighbor in sorted(self.adjacency_list[current]):
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        queue.append(neighbor)
+            for neighbor in targets[offsets[current]:offsets[current + 1]]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
         
-        return result
+        return [names[i] for i in result]
     
     def bfs_distances(self, start: str) -> Dict[str, int]:
         """BFS returning distances from start node"""
@@ -116,51 +150,51 @@ class GraphTraversal:
         if start not in self.adjacency_list:
             raise ValueError(f"El nodo {start} no existe en el grafo")
         
-        visited = set()
+        names, ids, offsets, targets = self._frozen()
+        visited = bytearray(len(names))
         result = []
         
-        self._dfs_recursive_helper(start, visited, result)
+        self._dfs_recursive_helper(ids[start], visited, result, offsets, targets)
         
-        return result
+        return [names[i] for i in result]
     
-    def _dfs_recursive_helper(self, node: str, visited: Set[str], result: List[str]):
+    def _dfs_recursive_helper(self, node: int, visited: bytearray, result: List[int],
+                              offsets: array, targets: array):
         """Helper for recursive DFS"""
-        visited.add(node)
+        visited[node] = 1
         result.append(node)
         
-        if node in self.adjacency_list:
-            for neighbor in sorted(self.adjacency_list[node]):
-                if neighbor not in visited:
-                    self._dfs_recursive_helper(neighbor, visited, result)
+        for neighbor in targets[offsets[node]:offsets[node + 1]]:
+            if not visited[neighbor]:
+                self._dfs_recursive_helper(neighbor, visited, result, offsets, targets)
     
     def dfs_iterative(self, start: str) -> List[str]:
         """DFS iterative traversal using explicit stack"""
         if start not in self.adjacency_list:
             raise ValueError(f"El nodo {start} no existe en el grafo")
         
-        visited = set()
+        names, ids, offsets, targets = self._frozen()
+        visited = bytearray(len(names))
         result = []
         stack = []
         
-        stack.append(start)
+        stack.append(ids[start])
         
         while stack:
             current = stack.pop()
             
-            if current in visited:
+            if visited[current]:
                 continue
             
-            visited.add(current)
+            visited[current] = 1
             result.append(current)
             
-            if current in self.adjacency_list:
-                neighbors = sorted(self.adjacency_list[current], reverse=True)
-                
-                for neighbor in neighbors:
-                    if neighbor not in visited:
-                        stack.append(neighbor)
+            # Push in reverse so the smallest neighbor is popped first
+            for neighbor in reversed(targets[offsets[current]:offsets[current + 1]]):
+                if not visited[neighbor]:
+                    stack.append(neighbor)
         
-        return result
+        return [names[i] for i in result]
     
     # ========================================
     # DETECCION DE CICLOS
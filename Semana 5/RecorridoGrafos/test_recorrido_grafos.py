@@ -0,0 +1,107 @@
+import pytest
+import random
+from collections import deque
+from recorrido_grafos import GraphTraversal
+
+def _expected_bfs(adjacency, start):
+    """BFS de referencia: vecinos en orden de nombre, como antes del CSR."""
+    visited = {start}
+    order = []
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        for neighbor in sorted(adjacency.get(current, [])):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+    return order
+
+def _expected_dfs(adjacency, start):
+    """DFS de referencia: se baja primero por el vecino de menor nombre."""
+    visited = set()
+    order = []
+
+    def visit(node):
+        visited.add(node)
+        order.append(node)
+        for neighbor in sorted(adjacency.get(node, [])):
+            if neighbor not in visited:
+                visit(neighbor)
+
+    visit(start)
+    return order
+
+def _expected_dfs_iterative(adjacency, start):
+    """DFS iterativo de referencia con pila (puede diferir del recursivo)."""
+    visited = set()
+    order = []
+    stack = [start]
+    while stack:
+        current = stack.pop()
+        if current in visited:
+            continue
+        visited.add(current)
+        order.append(current)
+        for neighbor in sorted(adjacency.get(current, []), reverse=True):
+            if neighbor not in visited:
+                stack.append(neighbor)
+    return order
+
+def _random_graph(rng, directed):
+    graph = GraphTraversal()
+    names = [f"n{i}" for i in range(rng.randint(1, 15))]
+    for _ in range(rng.randint(0, 30)):
+        u, v = rng.choice(names), rng.choice(names)  # Con lazos y aristas repetidas
+        if directed:
+            graph.add_directed_edge(u, v)
+        else:
+            graph.add_edge(u, v)
+    return graph
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_visit_order_matches_sorted_neighbors(directed):
+    """Test BFS y DFS sobre el CSR visitan en el mismo orden que ordenando por nombre."""
+    rng = random.Random(11 if directed else 12)
+    for _ in range(300):
+        graph = _random_graph(rng, directed)
+        adjacency = {node: list(neighbors) for node, neighbors in graph.adjacency_list.items()}
+        for start in adjacency:
+            assert graph.bfs(start) == _expected_bfs(adjacency, start)
+            assert graph.dfs_recursive(start) == _expected_dfs(adjacency, start)
+            assert graph.dfs_iterative(start) == _expected_dfs_iterative(adjacency, start)
+
+def test_freeze_orders_ids_by_name():
+    """Test los ids siguen el orden de los nombres y los vecinos quedan ordenados."""
+    graph = GraphTraversal()
+    graph.add_edge("C", "A")
+    graph.add_edge("C", "B")
+    graph.add_directed_edge("A", "D")
+
+    names, ids, offsets, targets = graph.freeze()
+
+    assert names == ["A", "B", "C", "D"]
+    assert ids == {"A": 0, "B": 1, "C": 2, "D": 3}
+    assert list(targets[offsets[ids["C"]]:offsets[ids["C"] + 1]]) == [0, 1]
+
+def test_add_edge_after_traversal_rebuilds_csr():
+    """Test agregar aristas tras un recorrido descarta el CSR viejo."""
+    graph = GraphTraversal()
+    graph.add_edge("A", "C")
+    assert graph.bfs("A") == ["A", "C"]
+
+    graph.add_edge("A", "B")
+    assert graph.bfs("A") == ["A", "B", "C"]
+
+    graph.add_directed_edge("C", "D")
+    assert graph.dfs_recursive("A") == ["A", "B", "C", "D"]
+    assert graph.dfs_iterative("D") == ["D"]
+
+def test_unknown_start_raises():
+    """Test nodo inicial inexistente."""
+    graph = GraphTraversal()
+    graph.add_edge("A", "B")
+
+    for traversal in (graph.bfs, graph.dfs_recursive, graph.dfs_iterative):
+        with pytest.raises(ValueError):
+            traversal("Z")
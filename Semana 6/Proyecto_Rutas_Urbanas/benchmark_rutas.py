@@ -0,0 +1,443 @@
+import argparse
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from grafo_ponderado import WeightedGraph
+from ruta_optimizada import RouteOptimizer
+
+
+Edge = Tuple[int, int, float]
+
+# Floyd-Warshall (y analyze_network) es O(V^3) en Python puro: por encima de
+# este tamaño se omite para que el benchmark termine en un tiempo razonable
+FW_MAX_NODES = 200
+
+# Tamaños en los que se miden siempre floyd_warshall y analyze_network
+FW_SIZES = [50, 100, 200]
+ALL_PAIRS = ('floyd_warshall', 'analyze_network')
+
+# Ejecuciones cronometradas por medición; se reporta la más rápida
+DEFAULT_REPEAT = 5
+
+# Diferencia absoluta de tiempo por debajo de la cual no se reporta una
+# regresión: en mediciones de pocos milisegundos domina el ruido del sistema
+TIME_FLOOR_S = 0.002
+
+# Veces que se vuelve a medir una red con regresión de tiempo antes de
+# reportarla (las pausas de la máquina son intermitentes)
+DEFAULT_RETRIES = 2
+
+DEFAULT_SIZES = [1000, 10000]
+FULL_SIZES = [1000, 10000, 100000, 1000000]
+
+
+# ========================================
+# GENERADORES DE REDES SINTÉTICAS
+# ========================================
+
+def generate_grid_city(n: int, seed: int = 0) -> Tuple[int, List[Edge]]:
+    """
+    Genera una ciudad en cuadrícula (manzanas) de aproximadamente n nodos.
+
+    Args:
+        n: Número aproximado de intersecciones
+        seed: Semilla para los pesos aleatorios
+
+    Returns:
+        Tupla (número_de_nodos, aristas) con pesos en km entre 0.1 y 1.0
+    """
+    rng = random.Random(seed)
+    side = max(1, int(math.isqrt(n)))
+    edges = []
+
+    for r in range(side):
+        for c in range(side):
+            u = r * side + c
+            if c + 1 < side:
+                edges.append((u, u + 1, round(rng.uniform(0.1, 1.0), 3)))
+            if r + 1 < side:
+                edges.append((u, u + side, round(rng.uniform(0.1, 1.0), 3)))
+
+    return side * side, edges
+
+
+def generate_random_geometric(n: int, seed: int = 0,
+                              radius: Optional[float] = None) -> Tuple[int, List[Edge]]:
+    """
+    Genera un grafo geométrico aleatorio en el cuadrado unitario.
+
+    Conecta pares de puntos a distancia menor que radius usando una rejilla
+    de celdas de lado radius, por lo que no compara todos los pares.
+
+    Args:
+        n: Número de nodos
+        seed: Semilla para las coordenadas
+        radius: Radio de conexión (por defecto, el umbral de conectividad)
+
+    Returns:
+        Tupla (número_de_nodos, aristas) con la distancia euclidiana como peso
+    """
+    rng = random.Random(seed)
+    if radius is None:
+        radius = math.sqrt(2.0 * math.log(max(n, 2)) / (math.pi * n))
+
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+    cells: Dict[Tuple[int, int], List[int]] = {}
+    for i, (x, y) in enumerate(points):
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(i)
+
+    edges = []
+    for (cx, cy), members in cells.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                others = cells.get((cx + dx, cy + dy))
+                if not others:
+                    continue
+                for u in members:
+                    xu, yu = points[u]
+                    for v in others:
+                        if v <= u:
+                            continue
+                        d = math.hypot(xu - points[v][0], yu - points[v][1])
+                        if d < radius:
+                            edges.append((u, v, d))
+
+    return n, edges
+
+
+def generate_scale_free(n: int, seed: int = 0, m: int = 2) -> Tuple[int, List[Edge]]:
+    """
+    Genera una red libre de escala con el modelo de Barabási-Albert.
+
+    Args:
+        n: Número de nodos
+        seed: Semilla del generador
+        m: Aristas que aporta cada nodo nuevo
+
+    Returns:
+        Tupla (número_de_nodos, aristas) con pesos en km entre 0.1 y 5.0
+    """
+    rng = random.Random(seed)
+    if n < 2:
+        return n, []
+    m = max(1, min(m, n - 1))
+    edges = []
+    # Cada nodo aparece una vez por cada arista incidente (enlace preferencial)
+    repeated: List[int] = []
+
+    for v in range(1, m + 1):
+        edges.append((0, v, round(rng.uniform(0.1, 5.0), 3)))
+        repeated.extend((0, v))
+
+    for v in range(m + 1, n):
+        targets = set()
+        while len(targets) < m:
+            targets.add(rng.choice(repeated))
+        for u in targets:
+            edges.append((u, v, round(rng.uniform(0.1, 5.0), 3)))
+            repeated.extend((u, v))
+
+    return n, edges
+
+
+GENERATORS: Dict[str, Callable[..., Tuple[int, List[Edge]]]] = {
+    'grid': generate_grid_city,
+    'geometric': generate_random_geometric,
+    'scale_free': generate_scale_free,
+}
+
+
+def build_graph(n: int, edges: List[Edge]) -> WeightedGraph:
+    """Construye un WeightedGraph no dirigido a partir de una lista de aristas."""
+    g = WeightedGraph(n)
+    for u, v, w in edges:
+        g.add_edge(u, v, w, directed=False)
+    return g
+
+
+# ========================================
+# MEDICIÓN
+# ========================================
+
+def _measure(fn: Callable[[], object],
+             repeat: int = DEFAULT_REPEAT) -> Tuple[float, float]:
+    """
+    Mide tiempo de CPU y memoria pico de fn.
+
+    Se usa tiempo de CPU del proceso en lugar de tiempo de pared, y el
+    mínimo de repeat ejecuciones, porque son las medidas menos afectadas
+    por otros procesos de la máquina. La memoria se mide en una ejecución
+    adicional con tracemalloc (que distorsiona los tiempos).
+
+    Returns:
+        Tupla (segundos, memoria_pico_kb)
+    """
+    times = []
+    for _ in range(max(1, repeat)):
+        start = time.process_time()
+        fn()
+        times.append(time.process_time() - start)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return min(times), peak / 1024
+
+
+def _settled(graph: WeightedGraph, src: int) -> int:
+    """Nodos que fija Dijkstra desde src (sin contar entradas obsoletas del heap)."""
+    stats: Dict[str, int] = {}
+    graph.dijkstra(src, stats)
+    return stats['settled']
+
+
+def bench_network(kind: str, size: int, queries: int = 5, seed: int = 0,
+                  repeat: int = DEFAULT_REPEAT) -> Dict[str, Dict[str, float]]:
+    """
+    Ejecuta los algoritmos de la semana sobre una red sintética.
+
+    Args:
+        kind: Tipo de red ('grid', 'geometric' o 'scale_free')
+        size: Número aproximado de nodos
+        queries: Número de consultas de origen aleatorio
+        seed: Semilla para la red y las consultas
+        repeat: Ejecuciones cronometradas por consulta
+
+    Returns:
+        Diccionario {"tipo/tamaño/algoritmo": {"time_s", "peak_kb", "settled"}}
+        donde settled es el número de nodos que fija Dijkstra (0 para
+        Floyd-Warshall, que no usa cola de prioridad)
+    """
+    n, edges = GENERATORS[kind](size, seed=seed)
+    graph = build_graph(n, edges)
+    rng = random.Random(seed + 1)
+    sources = [rng.randrange(n) for _ in range(queries)]
+    prefix = f"{kind}/{size}"
+    results = {}
+
+    # Dijkstra: tiempo y memoria promedio por consulta
+    total_time = total_peak = total_settled = 0.0
+    for src in sources:
+        elapsed, peak = _measure(lambda: graph.dijkstra(src), repeat)
+        total_time += elapsed
+        total_peak += peak
+        total_settled += _settled(graph, src)
+    results[f"{prefix}/dijkstra"] = {
+        'time_s': total_time / queries,
+        'peak_kb': total_peak / queries,
+        'settled': total_settled / queries,
+    }
+
+    # optimize_route: incluye mapeo de nombres y reconstrucción del camino
+    optimizer = RouteOptimizer()
+    optimizer.load_city_network([str(i) for i in range(n)],
+                                [(str(u), str(v), w) for u, v, w in edges])
+    total_time = total_peak = total_settled = 0.0
+    for src in sources:
+        dest = str(rng.randrange(n))
+        elapsed, peak = _measure(lambda: optimizer.optimize_route(str(src), dest), repeat)
+        total_time += elapsed
+        total_peak += peak
+        total_settled += _settled(optimizer.graph, src)  # Sin tráfico usa el mismo grafo
+    results[f"{prefix}/optimize_route"] = {
+        'time_s': total_time / queries,
+        'peak_kb': total_peak / queries,
+        'settled': total_settled / queries,
+    }
+
+    if n <= FW_MAX_NODES:
+        results.update(_bench_all_pairs(prefix, graph, optimizer, repeat))
+
+    return results
+
+
+def bench_all_pairs(kind: str, size: int, seed: int = 0,
+                    repeat: int = DEFAULT_REPEAT) -> Dict[str, Dict[str, float]]:
+    """
+    Mide solo floyd_warshall y analyze_network sobre una red sintética.
+
+    Args:
+        kind: Tipo de red ('grid', 'geometric' o 'scale_free')
+        size: Número aproximado de nodos (conviene no pasar de FW_MAX_NODES)
+        seed: Semilla de la red
+        repeat: Ejecuciones cronometradas por medición
+
+    Returns:
+        Diccionario con el mismo formato que bench_network
+    """
+    n, edges = GENERATORS[kind](size, seed=seed)
+    optimizer = RouteOptimizer()
+    optimizer.load_city_network([str(i) for i in range(n)],
+                                [(str(u), str(v), w) for u, v, w in edges])
+    return _bench_all_pairs(f"{kind}/{size}", optimizer.graph, optimizer, repeat)
+
+
+def _bench_all_pairs(prefix: str, graph: WeightedGraph, optimizer: RouteOptimizer,
+                     repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    elapsed, peak = _measure(graph.floyd_warshall, repeat)
+    results[f"{prefix}/floyd_warshall"] = {
+        'time_s': elapsed, 'peak_kb': peak, 'settled': 0.0
+    }
+    elapsed, peak = _measure(optimizer.analyze_network, repeat)
+    results[f"{prefix}/analyze_network"] = {
+        'time_s': elapsed, 'peak_kb': peak, 'settled': 0.0
+    }
+    return results
+
+
+def run_suite(sizes: List[int], kinds: Optional[List[str]] = None, queries: int = 5,
+              seed: int = 0, repeat: int = DEFAULT_REPEAT,
+              fw_sizes: Optional[List[int]] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Ejecuta bench_network para cada combinación de tipo de red y tamaño, y
+    bench_all_pairs para los tamaños de fw_sizes (por defecto FW_SIZES),
+    porque los tamaños de caminos desde un origen son demasiado grandes
+    para Floyd-Warshall.
+    """
+    results = {}
+    for kind in kinds or list(GENERATORS):
+        for size in sizes:
+            results.update(bench_network(kind, size, queries, seed, repeat))
+        for size in FW_SIZES if fw_sizes is None else fw_sizes:
+            if size not in sizes:
+                results.update(bench_all_pairs(kind, size, seed, repeat))
+    return results
+
+
+def compare_results(baseline: Dict[str, Dict[str, float]],
+                    current: Dict[str, Dict[str, float]],
+                    threshold: float = 0.25,
+                    time_floor_s: float = TIME_FLOOR_S) -> List[str]:
+    """
+    Compara resultados contra una línea base.
+
+    Args:
+        baseline: Resultados guardados previamente
+        current: Resultados de la ejecución actual
+        threshold: Incremento relativo tolerado (0.25 = 25%)
+        time_floor_s: Incremento absoluto de tiempo que se ignora siempre
+
+    Returns:
+        Lista de descripciones de regresiones (vacía si no hay)
+    """
+    regressions = []
+    for key, metric, old, new in _regressions(baseline, current, threshold, time_floor_s):
+        regressions.append(
+            f"{key} {metric}: {old:.4g} -> {new:.4g} (+{(new / old - 1) * 100:.1f}%)"
+        )
+    return regressions
+
+
+def _regressions(baseline: Dict[str, Dict[str, float]],
+                 current: Dict[str, Dict[str, float]], threshold: float,
+                 time_floor_s: float) -> Iterator[Tuple[str, str, float, float]]:
+    """Genera (clave, métrica, antes, ahora) por cada métrica que empeoró."""
+    for key, now in sorted(current.items()):
+        before = baseline.get(key)
+        if before is None:
+            continue
+        for metric in ('time_s', 'peak_kb', 'settled'):
+            old, new = before.get(metric), now.get(metric)
+            if old is None or new is None or old <= 0:
+                continue
+            if metric == 'time_s' and new - old <= time_floor_s:
+                continue
+            if new > old * (1 + threshold):
+                yield key, metric, old, new
+
+
+def confirm_time_regressions(baseline: Dict[str, Dict[str, float]],
+                             current: Dict[str, Dict[str, float]],
+                             threshold: float = 0.25, retries: int = DEFAULT_RETRIES,
+                             queries: int = 5, seed: int = 0,
+                             repeat: int = DEFAULT_REPEAT) -> Dict[str, Dict[str, float]]:
+    """
+    Vuelve a medir las redes con regresiones de tiempo y conserva el menor
+    tiempo observado, para no reportar pausas pasajeras de la máquina.
+
+    Memoria y extracciones del heap son deterministas y no se re-miden.
+
+    Returns:
+        Copia de current con los tiempos actualizados
+    """
+    current = {key: dict(metrics) for key, metrics in current.items()}
+    for _ in range(retries):
+        suspects = {key.rsplit('/', 1)[0]
+                    for key, metric, _, _ in _regressions(baseline, current, threshold, TIME_FLOOR_S)
+                    if metric == 'time_s'}
+        if not suspects:
+            break
+        for group in sorted(suspects):
+            kind, size = group.split('/')
+            if all(key.rsplit('/', 1)[1] in ALL_PAIRS for key in current if key.startswith(group + '/')):
+                again = bench_all_pairs(kind, int(size), seed, repeat)
+            else:
+                again = bench_network(kind, int(size), queries, seed, repeat)
+            for key, metrics in again.items():
+                if key in current:
+                    current[key]['time_s'] = min(current[key]['time_s'], metrics['time_s'])
+    return current
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de caminos más cortos en redes sintéticas")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--full', action='store_true', help="Tamaños de 1k a 1M nodos")
+    parser.add_argument('--fw-sizes', type=int, nargs='*', default=FW_SIZES,
+                        help="Tamaños para floyd_warshall y analyze_network")
+    parser.add_argument('--kinds', nargs='+', choices=list(GENERATORS))
+    parser.add_argument('--queries', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', help="Guardar resultados como línea base JSON")
+    parser.add_argument('--compare', help="Comparar contra una línea base JSON")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help="Ejecuciones cronometradas por medición (se usa la más rápida)")
+    parser.add_argument('--threshold', type=float,
+                        help="Umbral de regresión (por defecto, el de la línea base o 0.25)")
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES,
+                        help="Nuevas mediciones antes de reportar una regresión de tiempo")
+    args = parser.parse_args(argv)
+
+    sizes = FULL_SIZES if args.full else args.sizes
+    results = run_suite(sizes, args.kinds, args.queries, args.seed, args.repeat, args.fw_sizes)
+
+    for key, metrics in sorted(results.items()):
+        print(f"{key:40s} {metrics['time_s'] * 1000:10.2f} ms "
+              f"{metrics['peak_kb']:12.1f} KB {metrics['settled']:12.0f} nodos")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'threshold': args.threshold if args.threshold is not None else 0.25,
+                       'results': results}, f, indent=2)
+        print(f"\n[GUARDADO] Línea base guardada en '{args.save}'")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        # Un umbral explícito tiene prioridad sobre el guardado con la línea base
+        threshold = args.threshold if args.threshold is not None else saved.get('threshold', 0.25)
+        results = confirm_time_regressions(saved['results'], results, threshold, args.retries,
+                                           args.queries, args.seed, args.repeat)
+        regressions = compare_results(saved['results'], results, threshold)
+        if regressions:
+            print(f"\n[ERROR] {len(regressions)} regresiones sobre el umbral de {threshold * 100:.0f}%:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\n[OK] Sin regresiones respecto a la línea base")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
-from route_optimizer import RouteOptimizer
+from ruta_optimizada import RouteOptimizer
+from exportacion_rutas import write_routes_ndjson
 import json
 
 
@@ -77,6 +78,13 @@ def main():
         print(f"  Camino optimo: {' -> '.join(path)}")
         print(f"  Distancia: {dist:.2f} km\n")
     
+    # Exportar las rutas ya calculadas, una por línea (NDJSON)
+    written = write_routes_ndjson(
+        ((r['origen'], r['destino'], r['camino'], r['distancia']) for r in route_results),
+        'resultados_rutas.ndjson'
+    )
+    print(f"[GUARDADO] {written} rutas exportadas a 'resultados_rutas.ndjson'\n")
+    
     # ========== PARTE 2: ANÁLISIS DE RED CON FLOYD-WARSHALL ==========
     print("=" * 70)
     print("PARTE 2: ANÁLISIS DE RED (FLOYD-WARSHALL)")
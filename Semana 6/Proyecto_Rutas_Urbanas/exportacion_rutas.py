@@ -0,0 +1,210 @@
+import gzip
+import itertools
+import json
+import math
+import os
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ruta_optimizada import RouteOptimizer
+
+
+# Tamaño del bloque de lectura al escanear un archivo parcial
+_SCAN_CHUNK = 1 << 20
+
+
+def _scan_ndjson(file_path: str) -> Tuple[int, int]:
+    """
+    Cuenta las líneas completas de un archivo NDJSON sin cargarlo en memoria.
+
+    Returns:
+        Tupla (líneas_completas, bytes_válidos) donde bytes_válidos es la
+        posición justo después del último salto de línea
+    """
+    lines = 0
+    valid = 0
+    offset = 0
+
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(_SCAN_CHUNK)
+            if not chunk:
+                break
+            count = chunk.count(b'\n')
+            if count:
+                lines += count
+                valid = offset + chunk.rindex(b'\n') + 1
+            offset += len(chunk)
+
+    return lines, valid
+
+
+def _scan_gzip(file_path: str) -> Tuple[int, int]:
+    """
+    Cuenta las líneas de los miembros gzip completos de un archivo.
+
+    Cada lote se escribe como un miembro gzip independiente, de modo que
+    un corte a mitad de escritura sólo invalida el último miembro.
+
+    Returns:
+        Tupla (líneas_completas, bytes_válidos) donde bytes_válidos es el
+        final del último miembro gzip íntegro
+    """
+    lines = 0
+    valid = 0
+    offset = 0
+    member_lines = 0
+    decomp = zlib.decompressobj(wbits=31)
+
+    with open(file_path, 'rb') as f:
+        while True:
+            data = f.read(_SCAN_CHUNK)
+            if not data:
+                break
+
+            while data:
+                try:
+                    out = decomp.decompress(data)
+                except zlib.error:
+                    return lines, valid  # Datos corruptos: conservar lo íntegro
+
+                member_lines += out.count(b'\n')
+
+                if decomp.eof:
+                    # Fin de un miembro: lo sobrante pertenece al siguiente
+                    offset += len(data) - len(decomp.unused_data)
+                    lines += member_lines
+                    valid = offset
+                    member_lines = 0
+                    data = decomp.unused_data
+                    decomp = zlib.decompressobj(wbits=31)
+                else:
+                    offset += len(data)
+                    data = b''
+
+    return lines, valid
+
+
+def _route_record(start: str, end: str, path: List[str], dist: float) -> bytes:
+    """Serializa una ruta como una línea NDJSON."""
+    record = {
+        'origen': start,
+        'destino': end,
+        'camino': path,
+        'distancia': dist if not math.isinf(dist) else None  # Sin camino
+    }
+    return (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def stream_routes_ndjson(optimizer: RouteOptimizer, pairs: Iterable[Tuple[str, str]],
+                         file_path: str, compress: Optional[bool] = None,
+                         resume: bool = True, use_traffic: bool = False,
+                         batch_size: int = 1000) -> Dict[str, int]:
+    """
+    Exporta rutas óptimas a un archivo NDJSON (una ruta por línea) a medida
+    que se calculan.
+
+    La memoria usada es acotada: sólo se mantiene un lote de batch_size
+    líneas antes de escribirlo. Los pares consecutivos con el mismo origen
+    comparten una única ejecución de Dijkstra.
+
+    Args:
+        optimizer: Optimizador con la red ya cargada
+        pairs: Iterable de tuplas (origen, destino), en orden determinista
+        file_path: Archivo de salida
+        compress: Si se comprime con gzip (por defecto, si termina en .gz)
+        resume: Si se continúa un archivo parcial, omitiendo los pares ya escritos
+        use_traffic: Si se debe considerar el tráfico
+        batch_size: Número de rutas por escritura
+
+    Returns:
+        Diccionario con 'skipped' (rutas ya presentes) y 'written' (rutas nuevas)
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size debe ser positivo")
+    if compress is None:
+        compress = file_path.endswith('.gz')
+
+    skipped = 0
+    append = False
+    if resume and os.path.exists(file_path):
+        skipped, valid = (_scan_gzip if compress else _scan_ndjson)(file_path)
+        # Descartar la última escritura incompleta
+        with open(file_path, 'r+b') as f:
+            f.truncate(valid)
+        append = True
+
+    pending = itertools.islice(iter(pairs), skipped, None)
+
+    def routes():
+        for start, group in itertools.groupby(pending, key=lambda pair: pair[0]):
+            ends = (end for _, end in group)
+            for end, path, dist in optimizer.optimize_routes_from(start, ends, use_traffic):
+                yield start, end, path, dist
+
+    written = write_routes_ndjson(routes(), file_path, compress, append, batch_size)
+    return {'skipped': skipped, 'written': written}
+
+
+def write_routes_ndjson(routes: Iterable[Tuple[str, str, List[str], float]],
+                        file_path: str, compress: Optional[bool] = None,
+                        append: bool = False, batch_size: int = 1000) -> int:
+    """
+    Escribe rutas ya calculadas en un archivo NDJSON (una ruta por línea).
+
+    Args:
+        routes: Iterable de tuplas (origen, destino, camino, distancia)
+        file_path: Archivo de salida
+        compress: Si se comprime con gzip (por defecto, si termina en .gz)
+        append: Si se agrega al final del archivo en lugar de reemplazarlo
+        batch_size: Número de rutas por escritura
+
+    Returns:
+        Número de rutas escritas
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size debe ser positivo")
+    if compress is None:
+        compress = file_path.endswith('.gz')
+
+    written = 0
+    batch: List[bytes] = []
+
+    with open(file_path, 'ab' if append else 'wb') as f:
+        def flush():
+            data = b''.join(batch)
+            f.write(gzip.compress(data, compresslevel=6) if compress else data)
+            f.flush()
+            batch.clear()
+
+        for start, end, path, dist in routes:
+            batch.append(_route_record(start, end, path, dist))
+            written += 1
+            if len(batch) >= batch_size:
+                flush()
+
+        if batch:
+            flush()
+
+    return written
+
+
+def read_routes_ndjson(file_path: str, compress: Optional[bool] = None):
+    """
+    Lee un archivo NDJSON de rutas línea a línea.
+
+    Args:
+        file_path: Archivo generado por stream_routes_ndjson
+        compress: Si está comprimido con gzip (por defecto, si termina en .gz)
+
+    Yields:
+        Diccionarios con las claves origen, destino, camino y distancia
+    """
+    if compress is None:
+        compress = file_path.endswith('.gz')
+
+    opener = gzip.open if compress else open
+    with opener(file_path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -1,12 +1,35 @@
 import heapq
 import math
-from typing import Dict, List, Tuple, Optional
+from collections import deque
+from typing import Callable, Dict, List, Sequence, Tuple, Optional
+
+
+def _is_dominated(tail: Tuple[float, ...], labels: Optional[List[Tuple[float, ...]]]) -> bool:
+    """
+    Indica si alguna etiqueta de labels es menor o igual que tail en todos
+    los criterios.
+
+    Las etiquetas se comparan sin su primer criterio: en la búsqueda
+    multicriterio el orden lexicográfico ya garantiza que es menor o igual.
+    """
+    if not labels:
+        return False
+    if len(tail) == 2:
+        t0, t1 = tail
+        for a0, a1 in labels:
+            if a0 <= t0 and a1 <= t1:
+                return True
+        return False
+    if len(tail) == 1:
+        t0 = tail[0]
+        return any(a0 <= t0 for a0, in labels)
+    return any(all(a <= b for a, b in zip(label, tail)) for label in labels)
 
 
 class WeightedGraph:
     """
     Grafo ponderado para algoritmos de caminos más cortos.
-    Soporta Dijkstra y Floyd-Warshall.
+    Soporta Dijkstra, Bellman-Ford (SPFA) y Floyd-Warshall.
     """
     
     def __init__(self, n: int):
@@ -33,12 +56,14 @@ class WeightedGraph:
         if not directed:
             self.adj[v].append((u, w))
     
-    def dijkstra(self, src: int) -> Tuple[List[float], List[int]]:
+    def dijkstra(self, src: int, stats: Optional[Dict[str, int]] = None) -> Tuple[List[float], List[int]]:
         """
         Algoritmo de Dijkstra para caminos más cortos desde un origen único.
         
         Args:
             src: Nodo origen
+            stats: Si se indica, se le suma en 'settled' el número de nodos
+                   fijados (extracciones del heap que no estaban obsoletas)
             
         Returns:
             Tupla (distancias, padres) donde:
@@ -52,6 +77,7 @@ class WeightedGraph:
         # Cola de prioridad: (distancia, nodo)
         pq = [(0, src)]
         visited = [False] * self.n
+        settled = 0
         
         while pq:
             cost, u = heapq.heappop(pq)
@@ -60,6 +86,7 @@ class WeightedGraph:
                 continue
                 
             visited[u] = True
+            settled += 1
             
             # Relajación de aristas
             for v, w in self.adj[u]:
@@ -68,8 +95,78 @@ class WeightedGraph:
                     parent[v] = u
                     heapq.heappush(pq, (dist[v], v))
         
+        if stats is not None:
+            stats['settled'] = stats.get('settled', 0) + settled
         return dist, parent
-    
+
+    def bellman_ford_spfa(self, src: int) -> Tuple[List[float], List[int]]:
+        """
+        Bellman-Ford basado en cola (SPFA) para caminos más cortos desde un
+        origen único con pesos negativos.
+
+        Ordena la cola con las heurísticas SLF (Small Label First: un nodo con
+        distancia menor que el frente entra por delante) y LLL (Large Label
+        Last: el frente con distancia mayor al promedio pasa al final). Con
+        pocas aristas negativas cada nodo entra a la cola pocas veces, por lo
+        que el costo es cercano a O(V + E); el peor caso es O(V * E).
+
+        Args:
+            src: Nodo origen
+
+        Returns:
+            Tupla (distancias, padres) con el mismo formato que dijkstra
+
+        Raises:
+            ValueError: Si se detecta un ciclo negativo alcanzable desde src
+        """
+        dist = [math.inf] * self.n
+        parent = [-1] * self.n
+        length = [0] * self.n  # Número de aristas del camino actual
+        in_queue = [False] * self.n
+        dist[src] = 0
+
+        queue = deque([src])
+        in_queue[src] = True
+        queue_sum = 0.0  # Suma de distancias en cola (para LLL)
+
+        while queue:
+            u = queue.popleft()
+
+            # LLL: rotar mientras el frente supere el promedio de la cola
+            for _ in range(len(queue)):
+                if dist[u] * (len(queue) + 1) <= queue_sum:
+                    break
+                queue.append(u)
+                u = queue.popleft()
+
+            in_queue[u] = False
+            queue_sum = queue_sum - dist[u] if queue else 0.0
+
+            # Relajación de aristas
+            for v, w in self.adj[u]:
+                new_dist = dist[u] + w
+                if new_dist < dist[v]:
+                    if in_queue[v]:
+                        queue_sum += new_dist - dist[v]
+                    dist[v] = new_dist
+                    parent[v] = u
+
+                    # Un camino mínimo simple tiene a lo sumo n-1 aristas
+                    length[v] = length[u] + 1
+                    if length[v] >= self.n:
+                        raise ValueError(f"Ciclo negativo detectado en nodo {v}")
+
+                    if not in_queue[v]:
+                        in_queue[v] = True
+                        queue_sum += new_dist
+                        # SLF: distancias pequeñas al frente de la cola
+                        if queue and new_dist < dist[queue[0]]:
+                            queue.appendleft(v)
+                        else:
+                            queue.append(v)
+
+        return dist, parent
+
     def floyd_warshall(self) -> Tuple[List[List[float]], List[List[Optional[int]]]]:
         """
         Algoritmo de Floyd-Warshall para caminos más cortos entre todos los pares.
@@ -110,7 +207,132 @@ class WeightedGraph:
                 raise ValueError(f"Ciclo negativo detectado en nodo {i}")
         
         return dist, parent
-    
+
+    def pareto_paths(self, src: int, dest: int,
+                     criteria: Optional[Callable[[int, int, float], Sequence[float]]] = None,
+                     max_labels: int = 16) -> List[Tuple[Tuple[float, ...], List[int]]]:
+        """
+        Búsqueda multicriterio (label-setting) de los caminos Pareto-óptimos.
+
+        Cada arista tiene un vector de costos no negativos. Las etiquetas se
+        procesan en orden lexicográfico de costo + cota inferior, donde las
+        cotas son distancias exactas hacia dest por criterio (una ejecución
+        de Dijkstra inversa por criterio). Se descartan las etiquetas
+        dominadas por otra ya fijada en el mismo nodo o, usando la cota, por
+        una solución ya encontrada en dest.
+
+        Args:
+            src: Nodo origen
+            dest: Nodo destino
+            criteria: Función (u, v, peso) -> vector de costos de la arista
+                      (por defecto, sólo el peso)
+            max_labels: Máximo de etiquetas fijadas por nodo; la búsqueda
+                        termina al fijar max_labels soluciones en dest
+
+        Returns:
+            Lista de tuplas (vector_de_costos, camino) ordenada por costos
+
+        Raises:
+            ValueError: Si algún criterio de una arista es negativo
+        """
+        if criteria is None:
+            criteria = lambda u, v, w: (w,)
+
+        # Vectores por arista y adyacencia inversa para las cotas
+        vec_adj: List[List[Tuple[int, Tuple[float, ...]]]] = []
+        rev_adj: List[List[Tuple[int, Tuple[float, ...]]]] = [[] for _ in range(self.n)]
+        k = None
+        for u in range(self.n):
+            row = []
+            for v, w in self.adj[u]:
+                vec = tuple(criteria(u, v, w))
+                if k is None:
+                    k = len(vec)
+                if len(vec) != k:
+                    raise ValueError(f"La arista ({u}, {v}) tiene {len(vec)} criterios, se esperaban {k}")
+                if min(vec, default=0) < 0:
+                    raise ValueError(f"Criterio negativo en la arista ({u}, {v})")
+                row.append((v, vec))
+                rev_adj[v].append((u, vec))
+            vec_adj.append(row)
+
+        k = k or 1
+        bounds = [self._reverse_bound(rev_adj, dest, i) for i in range(k)]
+        if math.isinf(bounds[0][src]):
+            return []
+        node_bounds = [tuple(b[v] for b in bounds) for v in range(self.n)]
+
+        # Etiquetas: costo, nodo y etiqueta previa (para reconstruir caminos)
+        costs = [(0,) * k]
+        nodes = [src]
+        preds = [-1]
+        heap = [(node_bounds[src], 0)]
+        # Etiquetas fijadas por nodo, sin el primer criterio
+        settled: Dict[int, List[Tuple[float, ...]]] = {}
+        solutions = settled.setdefault(dest, [])
+        found: List[int] = []
+
+        while heap and len(found) < max_labels:
+            key, label = heapq.heappop(heap)
+            u = nodes[label]
+            cost = costs[label]
+
+            bucket = settled.setdefault(u, [])
+            if (len(bucket) >= max_labels or _is_dominated(cost[1:], bucket)
+                    or _is_dominated(key[1:], solutions)):
+                continue
+            bucket.append(cost[1:])
+
+            if u == dest:
+                found.append(label)
+                continue
+
+            for v, vec in vec_adj[u]:
+                bound = node_bounds[v]
+                if bound[0] == math.inf:
+                    continue  # dest no es alcanzable desde v
+                new_cost = tuple(c + x for c, x in zip(cost, vec))
+                new_key = tuple(c + b for c, b in zip(new_cost, bound))
+                if (_is_dominated(new_cost[1:], settled.get(v))
+                        or _is_dominated(new_key[1:], solutions)):
+                    continue
+
+                costs.append(new_cost)
+                nodes.append(v)
+                preds.append(label)
+                heapq.heappush(heap, (new_key, len(costs) - 1))
+
+        results = []
+        for label in found:
+            path = []
+            current = label
+            while current != -1:
+                path.append(nodes[current])
+                current = preds[current]
+            path.reverse()
+            results.append((costs[label], path))
+
+        return results
+
+    def _reverse_bound(self, rev_adj: List[List[Tuple[int, Tuple[float, ...]]]],
+                       dest: int, index: int) -> List[float]:
+        """Distancias mínimas hacia dest según un único criterio (Dijkstra inverso)."""
+        dist = [math.inf] * self.n
+        dist[dest] = 0
+        pq = [(0, dest)]
+
+        while pq:
+            d, v = heapq.heappop(pq)
+            if d > dist[v]:
+                continue
+            for u, vec in rev_adj[v]:
+                nd = d + vec[index]
+                if nd < dist[u]:
+                    dist[u] = nd
+                    heapq.heappush(pq, (nd, u))
+
+        return dist
+
     def get_path_dijkstra(self, parent: List[int], src: int, dest: int) -> List[int]:
         """
         Reconstruye el camino desde src hasta dest usando el array de padres de Dijkstra.
@@ -193,3 +415,9 @@ if __name__ == "__main__":
     fw_dist, fw_parent = g.floyd_warshall()
     print(f"Distancia de 0 a 5: {fw_dist[0][5]}")
     print(f"Camino de 0 a 5: {g.get_path_floyd_warshall(fw_parent, 0, 5)}")
+    
+    print("\n=== BELLMAN-FORD (SPFA) ===")
+    g.add_edge(2, 1, -4)  # Arista con rebaja de peaje
+    bf_dist, bf_parent = g.bellman_ford_spfa(0)
+    print(f"Distancias desde nodo 0: {bf_dist}")
+    print(f"Camino a nodo 5: {g.get_path_dijkstra(bf_parent, 0, 5)}")
@@ -1,6 +1,10 @@
 import pytest
 import math
-from weighted_graph import WeightedGraph
+import random
+from grafo_ponderado import WeightedGraph
+from ruta_optimizada import RouteOptimizer
+from exportacion_rutas import stream_routes_ndjson, read_routes_ndjson
+from benchmark_rutas import GENERATORS, build_graph, bench_network, compare_results, run_suite
 
 
 def test_dijkstra_simple():
@@ -154,5 +158,189 @@ def test_undirected_graph():
     assert dist_reverse[0] == 8
 
 
+def _small_city():
+    """Red urbana pequeña para las pruebas del optimizador."""
+    optimizer = RouteOptimizer()
+    nodes = ["A", "B", "C", "D"]
+    edges = [("A", "B", 1.0), ("B", "C", 2.0), ("A", "C", 4.0)]
+    optimizer.load_city_network(nodes, edges)
+    return optimizer
+
+
+def test_stream_routes_ndjson(tmp_path):
+    """Test exportación NDJSON: una ruta por línea, incluso sin camino."""
+    optimizer = _small_city()
+    pairs = [("A", "C"), ("A", "B"), ("B", "D")]
+    out = str(tmp_path / "rutas.ndjson")
+
+    stats = stream_routes_ndjson(optimizer, pairs, out, batch_size=2)
+    records = list(read_routes_ndjson(out))
+
+    assert stats == {'skipped': 0, 'written': 3}
+    assert records[0]['camino'] == ["A", "B", "C"]
+    assert records[0]['distancia'] == 3.0
+    assert records[2]['distancia'] is None
+
+
+@pytest.mark.parametrize("name", ["rutas.ndjson", "rutas.ndjson.gz"])
+def test_stream_routes_resume(tmp_path, name):
+    """Test reanudación tras una escritura interrumpida."""
+    optimizer = _small_city()
+    pairs = [("A", "C"), ("A", "B"), ("B", "C"), ("C", "A"), ("D", "A")]
+    out = str(tmp_path / name)
+
+    stream_routes_ndjson(optimizer, pairs[:3], out, batch_size=1)
+    with open(out, 'ab') as f:
+        f.write(b'{"origen": "C", "dest')  # Lote incompleto
+
+    stats = stream_routes_ndjson(optimizer, pairs, out, batch_size=1)
+    records = list(read_routes_ndjson(out))
+
+    assert stats == {'skipped': 3, 'written': 2}
+    assert [(r['origen'], r['destino']) for r in records] == pairs
+
+
+@pytest.mark.parametrize("kind", sorted(GENERATORS))
+def test_benchmark_generators_connected(kind):
+    """Test generadores sintéticos: redes conexas y deterministas."""
+    n, edges = GENERATORS[kind](400, seed=3)
+    again = GENERATORS[kind](400, seed=3)
+
+    dist, _ = build_graph(n, edges).dijkstra(0)
+
+    assert (n, edges) == again
+    assert kind == 'geometric' or all(not math.isinf(d) for d in dist)
+
+
+def test_benchmark_regression_detection():
+    """Test comparación contra línea base con umbral."""
+    current = bench_network('grid', 100, queries=2, repeat=1)
+    assert 'grid/100/floyd_warshall' in current
+    assert current['grid/100/dijkstra']['settled'] == 100  # Cada nodo se fija una vez
+    assert compare_results(current, current) == []
+
+    slower = {key: dict(m, time_s=m['time_s'] * 2) for key, m in current.items()}
+    regressions = compare_results(current, slower, threshold=0.5, time_floor_s=0)
+
+    assert len(regressions) == len(current)
+
+    # Diferencias de tiempo bajo el piso de ruido no cuentan como regresión
+    tiny = {'x': {'time_s': 0.001, 'peak_kb': 1.0, 'settled': 1.0}}
+    assert compare_results(tiny, {'x': dict(tiny['x'], time_s=0.002)}) == []
+
+
+def test_dijkstra_settled_ignores_stale_entries():
+    """Test settled cuenta nodos fijados, no entradas obsoletas del heap."""
+    g = WeightedGraph(3)
+    g.add_edge(0, 1, 5)
+    g.add_edge(0, 2, 1)
+    g.add_edge(2, 1, 1)  # 1 entra dos veces al heap
+    stats = {}
+
+    g.dijkstra(0, stats)
+
+    assert stats['settled'] == 3
+
+
+def test_benchmark_all_pairs_sweep():
+    """Test Floyd-Warshall y analyze_network se miden en la corrida por defecto."""
+    results = run_suite([100], kinds=['grid'], queries=1, repeat=1, fw_sizes=[50, 100])
+
+    assert 'grid/50/floyd_warshall' in results
+    assert 'grid/50/analyze_network' in results
+    assert 'grid/50/dijkstra' not in results
+    assert 'grid/100/floyd_warshall' in results
+
+
+def test_spfa_negative_edges():
+    """Test SPFA con aristas negativas sin ciclo."""
+    g = WeightedGraph(4)
+    g.add_edge(0, 1, 4)
+    g.add_edge(0, 2, 5)
+    g.add_edge(2, 1, -3)
+    g.add_edge(1, 3, 2)
+
+    dist, parent = g.bellman_ford_spfa(0)
+
+    assert dist == [0, 2, 5, 4]
+    assert g.get_path_dijkstra(parent, 0, 3) == [0, 2, 1, 3]
+
+
+def test_spfa_matches_floyd_warshall():
+    """Test SPFA coincide con Floyd-Warshall en un grafo aleatorio."""
+    rng = random.Random(7)
+    g = WeightedGraph(30)
+    for u in range(30):
+        for v in rng.sample(range(30), 4):
+            if u < v:
+                g.add_edge(u, v, rng.uniform(-2, 10))  # DAG: sin ciclos
+            elif u > v:
+                g.add_edge(u, v, rng.uniform(1, 10))
+
+    fw, _ = g.floyd_warshall()
+    for src in (0, 11, 29):
+        dist, _ = g.bellman_ford_spfa(src)
+        for v in range(30):
+            assert dist[v] == pytest.approx(fw[src][v])
+
+
+def test_spfa_negative_cycle():
+    """Test SPFA detecta ciclo negativo alcanzable."""
+    g = WeightedGraph(4)
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, -2)
+    g.add_edge(2, 1, 1)
+    g.add_edge(2, 3, 1)
+
+    with pytest.raises(ValueError, match="Ciclo negativo"):
+        g.bellman_ford_spfa(0)
+
+
+def _brute_force_pareto(g, src, dest, criteria):
+    """Frente de Pareto por enumeración de caminos simples (sólo grafos pequeños)."""
+    costs = []
+
+    def walk(u, seen, cost):
+        if u == dest:
+            costs.append(cost)
+            return
+        for v, w in g.adj[u]:
+            if v not in seen:
+                vec = criteria(u, v, w)
+                walk(v, seen | {v}, tuple(a + b for a, b in zip(cost, vec)))
+
+    walk(src, {src}, (0, 0))
+    return sorted(c for c in set(costs)
+                  if not any(o != c and all(a <= b for a, b in zip(o, c)) for o in costs))
+
+
+def test_pareto_paths_matches_brute_force():
+    """Test búsqueda multicriterio contra enumeración exhaustiva."""
+    rng = random.Random(3)
+    g = WeightedGraph(9)
+    for _ in range(30):
+        u, v = rng.sample(range(9), 2)
+        g.add_edge(u, v, rng.randint(1, 9), directed=False)
+    toll = {(u, v): rng.randint(0, 9) for u in range(9) for v in range(9)}
+    criteria = lambda u, v, w: (w, toll[(min(u, v), max(u, v))])
+
+    routes = g.pareto_paths(0, 8, criteria)
+
+    assert [cost for cost, _ in routes] == _brute_force_pareto(g, 0, 8, criteria)
+    for cost, path in routes:
+        assert path[0] == 0 and path[-1] == 8
+
+
+def test_pareto_routes_tolls():
+    """Test rutas Pareto: la ruta corta con peaje y la larga sin peaje."""
+    optimizer = _small_city()
+    optimizer.set_toll(("A", "B"), 5.0)
+
+    routes = optimizer.pareto_routes("A", "C")
+
+    assert routes == [(["A", "B", "C"], (3.0, 3.0, 5.0)),
+                      (["A", "C"], (4.0, 4.0, 0.0))]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,5 +1,5 @@
-from weighted_graph import WeightedGraph
-from typing import Dict, List, Tuple
+from grafo_ponderado import WeightedGraph
+from typing import Dict, Iterable, Iterator, List, Tuple
 import math
 
 
@@ -12,6 +12,7 @@ class RouteOptimizer:
         self.graph: WeightedGraph = None
         self.node_names: Dict[int, str] = {}
         self.traffic_multiplier: Dict[Tuple[int, int], float] = {}
+        self.toll_cost: Dict[Tuple[int, int], float] = {}
     
     def load_city_network(self, nodes: List[str], edges: List[Tuple[str, str, float]]):
         """
@@ -50,6 +51,38 @@ class RouteOptimizer:
         self.traffic_multiplier[(u, v)] = multiplier
         self.traffic_multiplier[(v, u)] = multiplier  # Bidireccional
     
+    def set_toll(self, edge: Tuple[str, str], cost: float):
+        """
+        Establece el costo de peaje de una arista.
+        
+        Args:
+            edge: Tupla (origen, destino)
+            cost: Costo del peaje (no negativo)
+        """
+        name_to_id = {name: i for i, name in self.node_names.items()}
+        u = name_to_id[edge[0]]
+        v = name_to_id[edge[1]]
+        
+        self.toll_cost[(u, v)] = cost
+        self.toll_cost[(v, u)] = cost  # Bidireccional
+    
+    def _traffic_graph(self) -> WeightedGraph:
+        """
+        Crea un grafo temporal con los pesos multiplicados por el tráfico.
+        
+        Returns:
+            Grafo dirigido con el mismo número de nodos que la red
+        """
+        temp_graph = WeightedGraph(self.graph.n)
+        
+        # Copiar aristas con multiplicadores de tráfico
+        for u in range(self.graph.n):
+            for v, w in self.graph.adj[u]:
+                multiplier = self.traffic_multiplier.get((u, v), 1.0)
+                temp_graph.add_edge(u, v, w * multiplier, directed=True)
+        
+        return temp_graph
+    
     def optimize_route(self, start: str, end: str, use_traffic: bool = False) -> Tuple[List[str], float]:
         """
         Encuentra la ruta óptima entre dos puntos.
@@ -67,25 +100,68 @@ class RouteOptimizer:
         start_id = name_to_id[start]
         end_id = name_to_id[end]
         
-        # Crear grafo temporal si hay tráfico
-        if use_traffic and self.traffic_multiplier:
-            temp_graph = WeightedGraph(self.graph.n)
-            
-            # Copiar aristas con multiplicadores de tráfico
-            for u in range(self.graph.n):
-                for v, w in self.graph.adj[u]:
-                    multiplier = self.traffic_multiplier.get((u, v), 1.0)
-                    temp_graph.add_edge(u, v, w * multiplier, directed=True)
-            
-            dist, parent = temp_graph.dijkstra(start_id)
-        else:
-            dist, parent = self.graph.dijkstra(start_id)
+        # Usar grafo temporal si hay tráfico
+        graph = self._traffic_graph() if use_traffic and self.traffic_multiplier else self.graph
+        dist, parent = graph.dijkstra(start_id)
         
         # Reconstruir camino
         path_ids = self.graph.get_path_dijkstra(parent, start_id, end_id)
         path_names = [self.node_names[i] for i in path_ids]
         
         return path_names, dist[end_id]
+
+    def optimize_routes_from(self, start: str, ends: Iterable[str],
+                             use_traffic: bool = False) -> Iterator[Tuple[str, List[str], float]]:
+        """
+        Calcula las rutas óptimas desde un mismo origen hacia varios destinos.
+
+        A diferencia de llamar optimize_route por cada par, ejecuta Dijkstra
+        una sola vez para el origen y reutiliza el árbol de padres.
+
+        Args:
+            start: Nombre del nodo de inicio
+            ends: Nombres de los nodos de destino
+            use_traffic: Si se debe considerar el tráfico
+
+        Yields:
+            Tuplas (destino, camino, distancia) en el orden de ends
+        """
+        name_to_id = {name: i for i, name in self.node_names.items()}
+        start_id = name_to_id[start]
+
+        graph = self._traffic_graph() if use_traffic and self.traffic_multiplier else self.graph
+        dist, parent = graph.dijkstra(start_id)
+
+        for end in ends:
+            end_id = name_to_id[end]
+            path_ids = self.graph.get_path_dijkstra(parent, start_id, end_id)
+            yield end, [self.node_names[i] for i in path_ids], dist[end_id]
+
+    def pareto_routes(self, start: str, end: str,
+                      max_labels: int = 16) -> List[Tuple[List[str], Tuple[float, float, float]]]:
+        """
+        Encuentra el conjunto de rutas Pareto-óptimas entre distancia,
+        tiempo ajustado por tráfico y costo de peajes.
+        
+        Args:
+            start: Nombre del nodo de inicio
+            end: Nombre del nodo de destino
+            max_labels: Máximo de etiquetas por intersección (acota el tiempo)
+            
+        Returns:
+            Lista de tuplas (camino, (distancia, tiempo, peaje)) donde ninguna
+            ruta es peor que otra en los tres criterios a la vez
+        """
+        name_to_id = {name: i for i, name in self.node_names.items()}
+        
+        def criteria(u: int, v: int, w: float) -> Tuple[float, float, float]:
+            return (w,
+                    w * self.traffic_multiplier.get((u, v), 1.0),
+                    self.toll_cost.get((u, v), 0.0))
+        
+        routes = self.graph.pareto_paths(name_to_id[start], name_to_id[end],
+                                         criteria, max_labels)
+        return [([self.node_names[i] for i in path], costs) for costs, path in routes]
     
     def analyze_network(self) -> Dict[str, any]:
         """
@@ -154,13 +230,7 @@ class RouteOptimizer:
             self.set_traffic(edge, multiplier)
         
         # Análisis con tráfico (crear grafo temporal)
-        temp_graph = WeightedGraph(self.graph.n)
-        for u in range(self.graph.n):
-            for v, w in self.graph.adj[u]:
-                mult = self.traffic_multiplier.get((u, v), 1.0)
-                temp_graph.add_edge(u, v, w * mult, directed=True)
-        
-        dist_traffic, _ = temp_graph.floyd_warshall()
+        dist_traffic, _ = self._traffic_graph().floyd_warshall()
         
         # Calcular distancia promedio con tráfico
         total = 0
@@ -1,4 +1,5 @@
 from mst import GraphMST
+from mst_dinamico import DynamicMST
 import time
 
 def main():
@@ -121,5 +122,18 @@ def main():
     print("  ambos algoritmos son eficientes. Kruskal es intuitivo para")
     print("  seleccionar las conexiones más baratas primero.")
 
+    # --- Actualización dinámica ---
+    print("\n" + "-" * 50)
+    print("ACTUALIZACIÓN DINÁMICA DE LA RED")
+    print("-" * 50)
+
+    dyn = DynamicMST.from_graph(g)
+    new_id = dyn.insert_edge(5, 6, 30)
+    print(f"[+] Nueva canalización {nodes[5]} <-> {nodes[6]} ($30k): costo ${dyn.cost}k")
+
+    dyn.delete_edge(new_id)
+    print(f"[-] Se descarta esa canalización: costo ${dyn.cost}k")
+    print(f"[VERIFICADO] Coincide con recalcular: {dyn.cost == kruskal_cost}")
+
 if __name__ == "__main__":
     main()
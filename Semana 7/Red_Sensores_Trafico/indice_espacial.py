@@ -0,0 +1,156 @@
+import heapq
+import math
+from typing import List, Optional, Sequence, Tuple
+
+Point = Tuple[float, ...]
+
+
+class KDTree:
+    """
+    Árbol k-d estático para consultas de vecinos más cercanos.
+    Las hojas guardan hasta leaf_size puntos que se comparan por fuerza
+    bruta; construirlo cuesta O(n log^2 n) y cada consulta es O(log n) en
+    promedio para puntos bien distribuidos.
+    """
+
+    def __init__(self, points: Sequence[Point], leaf_size: int = 16):
+        """
+        Construye el árbol.
+
+        Args:
+            points: Coordenadas de los puntos (todas de la misma dimensión)
+            leaf_size: Máximo de puntos por hoja
+
+        Raises:
+            ValueError: Si los puntos no tienen todos la misma dimensión
+        """
+        self.points: List[Point] = [tuple(p) for p in points]
+        self.dim = len(self.points[0]) if self.points else 0
+        if any(len(p) != self.dim for p in self.points):
+            raise ValueError("Todos los puntos deben tener la misma dimensión")
+
+        self.order: List[int] = list(range(len(self.points)))
+        # Nodos: rango [lo, hi) de self.order, eje y valor de corte, hijos
+        self.lo: List[int] = []
+        self.hi: List[int] = []
+        self.axis: List[int] = []
+        self.split: List[float] = []
+        self.left: List[int] = []
+        self.right: List[int] = []
+        self.node_label: List[int] = []  # Etiqueta común de los puntos del nodo, o -1
+        self._labels: Optional[Sequence[int]] = None
+
+        if self.points:
+            self._build(max(1, leaf_size))
+
+    def _new_node(self, lo: int, hi: int) -> int:
+        self.lo.append(lo)
+        self.hi.append(hi)
+        self.axis.append(-1)
+        self.split.append(0.0)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.node_label.append(-1)
+        return len(self.lo) - 1
+
+    def _build(self, leaf_size: int):
+        points = self.points
+        order = self.order
+        stack = [self._new_node(0, len(points))]
+
+        while stack:
+            node = stack.pop()
+            lo, hi = self.lo[node], self.hi[node]
+            if hi - lo <= leaf_size:
+                continue
+
+            # Cortar por el eje de mayor extensión, en la mediana
+            idxs = order[lo:hi]
+            axis = max(range(self.dim), key=lambda a: max(points[i][a] for i in idxs)
+                       - min(points[i][a] for i in idxs))
+            idxs.sort(key=lambda i: points[i][axis])
+            order[lo:hi] = idxs
+            mid = (lo + hi) // 2
+
+            self.axis[node] = axis
+            self.split[node] = points[order[mid]][axis]
+            self.left[node] = self._new_node(lo, mid)
+            self.right[node] = self._new_node(mid, hi)
+            stack.append(self.left[node])
+            stack.append(self.right[node])
+
+    def query(self, q: Point, k: int = 1, skip: int = -1) -> List[Tuple[float, int]]:
+        """
+        Los k puntos más cercanos a q.
+
+        Args:
+            q: Punto de consulta
+            k: Número de vecinos
+            skip: Índice de punto a ignorar (normalmente el propio q)
+
+        Returns:
+            Lista de tuplas (distancia, índice) ordenada por distancia
+        """
+        return self._search(q, k, skip, None, -1)
+
+    def label(self, labels: Sequence[int]):
+        """
+        Asocia una etiqueta a cada punto (por ejemplo, su componente) para
+        nearest_other. Los nodos cuyos puntos comparten etiqueta la guardan,
+        y así se descartan enteros en la búsqueda.
+        """
+        self._labels = labels
+        order = self.order
+        # Los hijos siempre tienen índice mayor que su padre
+        for node in range(len(self.lo) - 1, -1, -1):
+            if self.left[node] == -1:
+                first = labels[order[self.lo[node]]]
+                same = all(labels[order[i]] == first for i in range(self.lo[node], self.hi[node]))
+                self.node_label[node] = first if same else -1
+            else:
+                l, r = self.node_label[self.left[node]], self.node_label[self.right[node]]
+                self.node_label[node] = l if l == r else -1
+
+    def nearest_other(self, i: int) -> Optional[Tuple[float, int]]:
+        """
+        Punto más cercano a points[i] con una etiqueta distinta a la suya.
+        Requiere haber llamado antes a label.
+
+        Returns:
+            Tupla (distancia, índice), o None si todos comparten etiqueta
+        """
+        found = self._search(self.points[i], 1, i, self._labels, self._labels[i])
+        return found[0] if found else None
+
+    def _search(self, q: Point, k: int, skip: int, labels: Optional[Sequence[int]],
+                exclude: int) -> List[Tuple[float, int]]:
+        points, order = self.points, self.order
+        heap: List[Tuple[float, int]] = []  # Máximo en la raíz: (-distancia, -índice)
+        stack = [(0, 0.0)]
+
+        while stack:
+            node, bound = stack.pop()
+            if len(heap) == k and bound >= -heap[0][0]:
+                continue
+            if labels is not None and self.node_label[node] == exclude:
+                continue
+
+            if self.left[node] == -1:
+                for pos in range(self.lo[node], self.hi[node]):
+                    j = order[pos]
+                    if j == skip or (labels is not None and labels[j] == exclude):
+                        continue
+                    d = math.dist(q, points[j])
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-d, -j))
+                    elif (d, j) < (-heap[0][0], -heap[0][1]):
+                        heapq.heapreplace(heap, (-d, -j))
+                continue
+
+            diff = q[self.axis[node]] - self.split[node]
+            near, far = (self.left[node], self.right[node]) if diff < 0 else (self.right[node], self.left[node])
+            # Apilar primero el lado lejano para visitar antes el cercano
+            stack.append((far, max(bound, abs(diff))))
+            stack.append((near, bound))
+
+        return sorted((-d, -j) for d, j in heap)
@@ -1,5 +1,90 @@
 import heapq
-from typing import List, Tuple, Dict, Set
+import math
+import os
+import struct
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Tuple, Dict, Optional, Sequence, Set
+
+from indice_espacial import KDTree
+
+# --- SOPORTE PARA BORŮVKA PARALELO ---
+# Las funciones que ejecutan los procesos deben estar a nivel de módulo.
+
+# Mínimo de aristas por proceso para que valga la pena paralelizar
+_BORUVKA_MIN_CHUNK = 50000
+
+# Arreglos compartidos del proceso actual: nombre -> (SharedMemory, memoryview)
+_shared_arrays = {}
+
+# --- SOPORTE PARA BOSQUE DE EXPANSIÓN MÍNIMA ---
+# Componentes con menos aristas se resuelven en el proceso principal
+_FOREST_MIN_PARALLEL_EDGES = 20000
+
+
+def _component_mst(task: Tuple[int, List[Tuple[int, int, float]]]) -> Tuple[List[Tuple[int, int, float]], float]:
+    """Tarea de un proceso: MST de un componente con vértices renumerados 0..n-1."""
+    n, edges = task
+    g = GraphMST(n)
+    for u, v, w in edges:
+        g.add_edge(u, v, w)
+    return g.prim_mst(0)
+
+
+# --- SOPORTE PARA KRUSKAL EN MEMORIA EXTERNA ---
+# Registro de una arista en los tramos ordenados: (peso, posición en el archivo, u, v)
+_RUN_RECORD = struct.Struct('<dqii')
+
+# Registros leídos por bloque al mezclar los tramos
+_RUN_READ_RECORDS = 4096
+
+
+def _read_run(f):
+    """Lee un tramo ordenado del disco por bloques, registro a registro."""
+    f.seek(0)
+    while True:
+        block = f.read(_RUN_RECORD.size * _RUN_READ_RECORDS)
+        if not block:
+            return
+        yield from _RUN_RECORD.iter_unpack(block)
+
+
+def _cheapest_edges(eu, ev, ew, comp, lo: int, hi: int) -> Dict[int, Tuple[float, int]]:
+    """
+    Busca la arista más barata que sale de cada componente en edges[lo:hi].
+    Los empates se rompen por índice, lo que evita ciclos al contraer.
+    
+    Returns:
+        Diccionario componente -> (peso, índice de arista)
+    """
+    best = {}
+    for i in range(lo, hi):
+        cu = comp[eu[i]]
+        cv = comp[ev[i]]
+        if cu == cv:
+            continue
+        cand = (ew[i], i)
+        if cu not in best or cand < best[cu]:
+            best[cu] = cand
+        if cv not in best or cand < best[cv]:
+            best[cv] = cand
+    return best
+
+
+def _boruvka_attach(specs: Dict[str, Tuple[str, str]]):
+    """Inicializador de cada proceso: se conecta a los arreglos compartidos."""
+    for key, (name, fmt) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _shared_arrays[key] = (shm, shm.buf.cast(fmt))
+
+
+def _boruvka_worker(bounds: Tuple[int, int]) -> Dict[int, Tuple[float, int]]:
+    """Tarea de un proceso: aristas más baratas de un rango de aristas compartidas."""
+    arrays = {key: view for key, (_, view) in _shared_arrays.items()}
+    return _cheapest_edges(arrays['u'], arrays['v'], arrays['w'], arrays['comp'], *bounds)
+
 
 class GraphMST:
     """
@@ -31,11 +116,86 @@ class GraphMST:
         self.adj[u].append((v, w))
         self.adj[v].append((u, w))
 
+    @classmethod
+    def from_points(cls, points: Sequence[Tuple[float, ...]], k: int = 8) -> 'GraphMST':
+        """
+        Crea un grafo de candidatos a partir de coordenadas, sin generar
+        los O(n^2) pares: cada punto se conecta con sus k vecinos más
+        cercanos (árbol k-d) con la distancia euclidiana como peso.
+        Si esos vecinos dejan componentes separados, se agregan rondas de
+        Borůvka con la arista más corta entre componentes hasta conectarlos.
+        El MST de este grafo (con kruskal_mst o prim_mst) es el MST
+        euclidiano salvo en distribuciones muy irregulares: k entre 8 y 10
+        basta en la práctica en el plano, pero sólo la triangulación de
+        Delaunay lo garantiza.
+        
+        Args:
+            points: Coordenadas de cada vértice (índice = vértice)
+            k: Vecinos más cercanos por punto
+            
+        Returns:
+            GraphMST con las aristas candidatas
+        """
+        n = len(points)
+        g = cls(n)
+        if n < 2:
+            return g
+        
+        tree = KDTree(points)
+        dsu = cls.DSU(n)
+        seen = set()
+        
+        def add(u, v, d):
+            key = (u, v) if u < v else (v, u)
+            if key not in seen:
+                seen.add(key)
+                g.add_edge(key[0], key[1], d)
+                dsu.union(u, v)
+        
+        for u in range(n):
+            for d, v in tree.query(tree.points[u], k, skip=u):
+                add(u, v, d)
+        
+        # Conectar componentes: arista más corta que sale de cada uno
+        while True:
+            comp = [dsu.find(v) for v in range(n)]
+            best = {}
+            tree.label(comp)
+            for u in range(n):
+                found = tree.nearest_other(u)
+                if found is not None and (comp[u] not in best or found < best[comp[u]][:2]):
+                    best[comp[u]] = (found[0], found[1], u)
+            if not best:
+                break
+            for d, v, u in best.values():
+                add(u, v, d)
+        
+        return g
+
     # --- ALGORITMO DE PRIM ---
     def prim_mst(self, start_node: int = 0) -> Tuple[List[Tuple[int, int, float]], float]:
         """
         Encuentra el MST usando el algoritmo de Prim.
-        Ideal para grafos densos.
+        Elige la variante según la densidad del grafo: con E log V >= V^2 usa
+        la versión con arreglos O(V^2) (ideal para grafos densos); si no, la
+        versión con heap indexado O(E log V).
+        Sólo cubre el componente de start_node; para grafos desconectados
+        está minimum_spanning_forest.
+        
+        Args:
+            start_node: Nodo inicial para comenzar el árbol
+            
+        Returns:
+            Tupla (lista de aristas del MST, costo total)
+        """
+        if len(self.edges) * math.log2(max(self.V, 2)) >= self.V * self.V:
+            return self.prim_mst_dense(start_node)
+        return self.prim_mst_heap(start_node)
+
+    def prim_mst_lazy(self, start_node: int = 0) -> Tuple[List[Tuple[int, int, float]], float]:
+        """
+        Prim con heap perezoso: inserta cada arista incidente en la cola.
+        Complejidad O(E log E) en tiempo y O(E) en memoria.
         
         Args:
             start_node: Nodo inicial para comenzar el árbol
@@ -72,40 +232,252 @@ class GraphMST:
                     
         return mst_edges, mst_cost
 
+    def prim_mst_dense(self, start_node: int = 0) -> Tuple[List[Tuple[int, int, float]], float]:
+        """
+        Prim con arreglos de claves, sin cola de prioridad.
+        Cada paso busca el vértice de menor clave entre los que faltan, por lo
+        que cuesta O(V^2 + E) en tiempo y O(V) en memoria adicional.
+        
+        Args:
+            start_node: Nodo inicial para comenzar el árbol
+            
+        Returns:
+            Tupla (lista de aristas del MST, costo total)
+        """
+        key = [math.inf] * self.V
+        parent = [-1] * self.V
+        in_tree = [False] * self.V
+        key[start_node] = 0
+        
+        # Vértices fuera del árbol; pos permite quitarlos en O(1)
+        remaining = list(range(self.V))
+        pos = list(range(self.V))
+        
+        mst_edges = []
+        mst_cost = 0
+        
+        while remaining:
+            u = min(remaining, key=key.__getitem__)
+            if key[u] == math.inf:
+                break  # El resto no es alcanzable desde start_node
+            
+            last = remaining.pop()
+            if last != u:
+                remaining[pos[u]] = last
+                pos[last] = pos[u]
+            in_tree[u] = True
+            
+            if parent[u] != -1:
+                mst_edges.append((parent[u], u, key[u]))
+                mst_cost += key[u]
+            
+            for v, w in self.adj[u]:
+                if not in_tree[v] and w < key[v]:
+                    key[v] = w
+                    parent[v] = u
+                    
+        return mst_edges, mst_cost
+
+    def prim_mst_heap(self, start_node: int = 0) -> Tuple[List[Tuple[int, int, float]], float]:
+        """
+        Prim con heap indexado (decrease-key): cada vértice está a lo sumo una
+        vez en la cola, por lo que cuesta O(E log V) en tiempo y O(V) en memoria.
+        
+        Args:
+            start_node: Nodo inicial para comenzar el árbol
+            
+        Returns:
+            Tupla (lista de aristas del MST, costo total)
+        """
+        parent = [-1] * self.V
+        in_tree = [False] * self.V
+        heap = self.IndexedMinHeap(self.V)
+        heap.push(start_node, 0)
+        
+        mst_edges = []
+        mst_cost = 0
+        
+        while heap:
+            u, weight = heap.pop()
+            in_tree[u] = True
+            
+            if parent[u] != -1:
+                mst_edges.append((parent[u], u, weight))
+                mst_cost += weight
+            
+            for v, w in self.adj[u]:
+                if not in_tree[v] and heap.push(v, w):
+                    parent[v] = u
+                    
+        return mst_edges, mst_cost
+
+    # --- HEAP INDEXADO ---
+    class IndexedMinHeap:
+        """Heap binario de vértices con posición indexada para decrease-key."""
+        def __init__(self, n):
+            self.heap = []          # Vértices en orden de heap
+            self.pos = [-1] * n     # Posición de cada vértice en heap (-1 si no está)
+            self.key = [math.inf] * n
+
+        def __len__(self):
+            return len(self.heap)
+
+        def push(self, v, k):
+            """Inserta v o reduce su clave. Devuelve True si la clave cambió."""
+            if k >= self.key[v]:
+                return False
+            self.key[v] = k
+            if self.pos[v] == -1:
+                self.pos[v] = len(self.heap)
+                self.heap.append(v)
+            self._sift_up(self.pos[v])
+            return True
+
+        def pop(self):
+            """Extrae el vértice de menor clave como tupla (vértice, clave)."""
+            heap = self.heap
+            top = heap[0]
+            last = heap.pop()
+            self.pos[top] = -1
+            if heap:
+                heap[0] = last
+                self.pos[last] = 0
+                self._sift_down(0)
+            return top, self.key[top]
+
+        def _sift_up(self, i):
+            heap, pos, key = self.heap, self.pos, self.key
+            v = heap[i]
+            while i > 0:
+                p = (i - 1) >> 1
+                if key[heap[p]] <= key[v]:
+                    break
+                heap[i] = heap[p]
+                pos[heap[i]] = i
+                i = p
+            heap[i] = v
+            pos[v] = i
+
+        def _sift_down(self, i):
+            heap, pos, key = self.heap, self.pos, self.key
+            n = len(heap)
+            v = heap[i]
+            while True:
+                c = 2 * i + 1
+                if c >= n:
+                    break
+                if c + 1 < n and key[heap[c + 1]] < key[heap[c]]:
+                    c += 1
+                if key[v] <= key[heap[c]]:
+                    break
+                heap[i] = heap[c]
+                pos[heap[i]] = i
+                i = c
+            heap[i] = v
+            pos[v] = i
+
     # --- UNION-FIND OPTIMIZADO (DSU) ---
     class DSU:
-        """Estructura de datos Disjoint Set Union con optimizaciones."""
+        """
+        Estructura de datos Disjoint Set Union con optimizaciones.
+        Guarda padres y tamaños en arreglos compactos (array de enteros de
+        32 bits) y no usa recursión, por lo que no depende del límite de
+        recursión de Python.
+        """
         def __init__(self, n):
-            self.parent = list(range(n))
-            self.rank = [0] * n
+            self.parent = array('i', range(n))
+            self.size = array('i', [1]) * n
 
         def find(self, i):
-            """Encuentra el representante del conjunto con Path Compression."""
-            if self.parent[i] != i:
-                self.parent[i] = self.find(self.parent[i])
-            return self.parent[i]
+            """Encuentra el representante del conjunto con Path Halving iterativo."""
+            parent = self.parent
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
 
         def union(self, i, j):
-            """Une dos conjuntos con Union by Rank."""
+            """Une dos conjuntos con Union by Size."""
             root_i = self.find(i)
             root_j = self.find(j)
             
-            if root_i != root_j:
-                if self.rank[root_i] < self.rank[root_j]:
-                    self.parent[root_i] = root_j
-                elif self.rank[root_i] > self.rank[root_j]:
-                    self.parent[root_j] = root_i
-                else:
-                    self.parent[root_j] = root_i
-                    self.rank[root_i] += 1
-                return True
-            return False
+            if root_i == root_j:
+                return False
+            if self.size[root_i] < self.size[root_j]:
+                root_i, root_j = root_j, root_i
+            self.parent[root_j] = root_i
+            self.size[root_i] += self.size[root_j]
+            return True
+
+    class RollbackDSU:
+        """
+        Disjoint Set Union que permite deshacer uniones.
+        Usa Union by Rank sin compresión de caminos (find es O(log n)) y una
+        pila con cada unión realizada, de modo que rollback restaura un
+        estado anterior en O(1) por unión deshecha.
+        """
+        def __init__(self, n):
+            self.parent = array('i', range(n))
+            self.rank = array('b', [0]) * n
+            self.history = []  # (raíz absorbida, subió el rango de la otra)
+
+        def find(self, i):
+            """Encuentra el representante sin modificar la estructura."""
+            parent = self.parent
+            while parent[i] != i:
+                i = parent[i]
+            return i
+
+        def union(self, i, j):
+            """Une dos conjuntos con Union by Rank y registra la unión."""
+            root_i = self.find(i)
+            root_j = self.find(j)
+            
+            if root_i == root_j:
+                return False
+            if self.rank[root_i] < self.rank[root_j]:
+                root_i, root_j = root_j, root_i
+            self.parent[root_j] = root_i
+            grew = self.rank[root_i] == self.rank[root_j]
+            if grew:
+                self.rank[root_i] += 1
+            self.history.append((root_j, grew))
+            return True
+
+        def snapshot(self):
+            """Marca el estado actual para volver a él con rollback."""
+            return len(self.history)
+
+        def rollback(self, mark):
+            """Deshace las uniones hechas después de snapshot()."""
+            history = self.history
+            while len(history) > mark:
+                root_j, grew = history.pop()
+                root_i = self.parent[root_j]
+                self.parent[root_j] = root_j
+                if grew:
+                    self.rank[root_i] -= 1
+
+    def _sorted_edge_order(self) -> List[int]:
+        """
+        Índices de self.edges ordenados por peso (argsort estable).
+        Ordena enteros con los pesos en un arreglo de doubles en lugar de
+        comparar tuplas con una lambda.
+        
+        No es un argsort vectorizado: sorted() crea un entero y un float por
+        arista para las claves (unos 60 bytes por arista mientras dura el
+        ordenamiento), y self.edges y self.adj ya guardan cada arista dos
+        veces. Con decenas de millones de aristas no cabe en memoria; para
+        esos casos está external_kruskal_mst.
+        """
+        weights = array('d', (w for _, _, w in self.edges))
+        return sorted(range(len(weights)), key=weights.__getitem__)
 
     # --- ALGORITMO DE KRUSKAL ---
     def kruskal_mst(self) -> Tuple[List[Tuple[int, int, float]], float]:
         """
         Encuentra el MST usando el algoritmo de Kruskal.
-        Ideal para grafos dispersos.
+        Ideal para grafos dispersos. Se detiene al aceptar V-1 aristas.
         
         Returns:
             Tupla (lista de aristas del MST, costo total)
@@ -113,17 +485,508 @@ class GraphMST:
         mst_cost = 0
         mst_edges = []
         dsu = self.DSU(self.V)
+        edges = self.edges
 
-        # Ordenar aristas por peso
-        sorted_edges = sorted(self.edges, key=lambda item: item[2])
-
-        for u, v, w in sorted_edges:
+        for idx in self._sorted_edge_order():
+            u, v, w = edges[idx]
             if dsu.union(u, v):
                 mst_edges.append((u, v, w))
                 mst_cost += w
+                if len(mst_edges) == self.V - 1:
+                    break
                 
         return mst_edges, mst_cost
 
+    # --- AGRUPAMIENTO POR ENLACE SIMPLE (SINGLE-LINKAGE) ---
+    class Dendrogram:
+        """
+        Dendrograma de enlace simple en arreglos compactos.
+        La unión i junta los grupos left[i] y right[i] a la altura height[i]
+        y crea el grupo n + i; los grupos 0..n-1 son los vértices.
+        """
+        def __init__(self, n):
+            self.n = n
+            self.left = array('i')
+            self.right = array('i')
+            self.height = array('d')
+
+        def __len__(self):
+            return len(self.height)
+
+        def labels(self, k):
+            """
+            Etiqueta de grupo (0..k-1, por orden de aparición) de cada vértice
+            al cortar el dendrograma en k grupos. Si el grafo tiene más de k
+            componentes, devuelve un grupo por componente.
+            """
+            if not 1 <= k <= max(self.n, 1):
+                raise ValueError(f"k debe estar entre 1 y {self.n}")
+            n = self.n
+            dsu = GraphMST.DSU(n)
+            rep = array('i', range(n)) + array('i', [0]) * len(self)
+            for i in range(len(self)):
+                rep[n + i] = rep[self.left[i]]
+                if i < n - k:
+                    dsu.union(rep[self.left[i]], rep[self.right[i]])
+            return GraphMST._dsu_labels(dsu, n)
+
+    @staticmethod
+    def _dsu_labels(dsu: 'GraphMST.DSU', n: int) -> List[int]:
+        """Etiquetas 0..k-1 de los conjuntos del DSU, por orden de aparición."""
+        ids: Dict[int, int] = {}
+        return [ids.setdefault(dsu.find(v), len(ids)) for v in range(n)]
+
+    def single_linkage_clusters(self, k: int) -> List[int]:
+        """
+        Agrupa los vértices en k grupos por enlace simple: el mismo recorrido
+        de Kruskal, detenido tras V-k uniones (equivale a quitar las k-1
+        aristas más caras del MST).
+        
+        Args:
+            k: Número de grupos (1 a V)
+            
+        Returns:
+            Etiqueta de grupo (0..k-1, por orden de aparición) de cada vértice;
+            si el grafo tiene más de k componentes, un grupo por componente
+            
+        Raises:
+            ValueError: Si k está fuera de rango
+        """
+        if not 1 <= k <= max(self.V, 1):
+            raise ValueError(f"k debe estar entre 1 y {self.V}")
+        dsu = self.DSU(self.V)
+        unions = 0
+        edges = self.edges
+        
+        if k < self.V:
+            for idx in self._sorted_edge_order():
+                u, v, _ = edges[idx]
+                if dsu.union(u, v):
+                    unions += 1
+                    if unions == self.V - k:
+                        break
+        
+        return self._dsu_labels(dsu, self.V)
+
+    def single_linkage_dendrogram(self) -> 'GraphMST.Dendrogram':
+        """
+        Construye el dendrograma completo de enlace simple en una pasada
+        O(E log E); después, Dendrogram.labels(k) da los grupos para
+        cualquier k sin volver a ordenar aristas.
+        
+        Returns:
+            Dendrogram con una unión por arista del MST (bosque)
+        """
+        dendrogram = self.Dendrogram(self.V)
+        dsu = self.DSU(self.V)
+        cluster = array('i', range(self.V))  # Raíz del DSU -> id de grupo
+        edges = self.edges
+        
+        for idx in self._sorted_edge_order():
+            u, v, w = edges[idx]
+            ru, rv = dsu.find(u), dsu.find(v)
+            if ru == rv:
+                continue
+            dendrogram.left.append(cluster[ru])
+            dendrogram.right.append(cluster[rv])
+            dendrogram.height.append(w)
+            dsu.union(ru, rv)
+            cluster[dsu.find(ru)] = self.V + len(dendrogram) - 1
+            if len(dendrogram) == self.V - 1:
+                break
+        
+        return dendrogram
+
+    # --- ALGORITMO FILTER-KRUSKAL ---
+    def filter_kruskal_mst(self, threshold: int = 1024) -> Tuple[List[Tuple[int, int, float]], float]:
+        """
+        Encuentra el MST usando Filter-Kruskal.
+        Parte las aristas alrededor de un peso pivote (como quicksort) y
+        procesa primero las ligeras; antes de ordenar las pesadas descarta las
+        que ya unen vértices del mismo componente. Cuando hay muchas más
+        aristas candidatas que aristas del árbol, la mayoría de las pesadas
+        nunca se ordena. Los empates se resuelven igual que en kruskal_mst.
+        
+        Args:
+            threshold: Tamaño a partir del cual un grupo se ordena directamente
+            
+        Returns:
+            Tupla (lista de aristas del MST, costo total)
+        """
+        mst_cost = 0
+        mst_edges = []
+        dsu = self.DSU(self.V)
+        edges = self.edges
+        weights = array('d', (w for _, _, w in edges))
+        
+        # Pila explícita de (índices, filtrar, partir) con los grupos ligeros arriba
+        stack = [(list(range(len(edges))), False, True)]
+        
+        while stack and len(mst_edges) < self.V - 1:
+            idxs, needs_filter, split = stack.pop()
+            
+            if needs_filter:
+                find = dsu.find
+                idxs = [i for i in idxs if find(edges[i][0]) != find(edges[i][1])]
+            
+            if split and len(idxs) > threshold:
+                # Pivote: mediana de tres pesos del grupo
+                pivot = sorted((weights[idxs[0]], weights[idxs[len(idxs) // 2]], weights[idxs[-1]]))[1]
+                light = [i for i in idxs if weights[i] < pivot]
+                equal = [i for i in idxs if weights[i] == pivot]
+                heavy = [i for i in idxs if weights[i] > pivot]
+                stack.append((heavy, True, True))
+                # Todas del mismo peso: volver a partirlas no reduciría el grupo
+                stack.append((equal, True, False))
+                if light:
+                    stack.append((light, False, True))
+                continue
+            
+            idxs.sort(key=weights.__getitem__)
+            for i in idxs:
+                u, v, w = edges[i]
+                if dsu.union(u, v):
+                    mst_edges.append((u, v, w))
+                    mst_cost += w
+                    if len(mst_edges) == self.V - 1:
+                        break
+        
+        return mst_edges, mst_cost
+
+    # --- BOSQUE DE EXPANSIÓN MÍNIMA ---
+    def minimum_spanning_forest(self, workers: Optional[int] = None
+                                ) -> List[Tuple[List[int], List[Tuple[int, int, float]], float]]:
+        """
+        Encuentra el MST de cada componente conexo (bosque de expansión mínima).
+        Los componentes se obtienen con un recorrido lineal y sus MST se
+        calculan con prim_mst en un pool de procesos, empezando por los más
+        grandes; los componentes pequeños se resuelven en este proceso
+        mientras tanto.
+        
+        Args:
+            workers: Número de procesos (por defecto, número de CPUs).
+                     Con 1 todo se ejecuta en este proceso.
+            
+        Returns:
+            Lista, ordenada por el menor vértice de cada componente, de tuplas
+            (vértices, aristas del MST, costo); un vértice aislado da ([v], [], 0)
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        # Componentes conexos en O(V + E)
+        comp_of = [-1] * self.V
+        components: List[List[int]] = []
+        for s in range(self.V):
+            if comp_of[s] != -1:
+                continue
+            c = len(components)
+            comp_of[s] = c
+            members = [s]
+            for x in members:  # La lista crece mientras se recorre (BFS)
+                for y, _ in self.adj[x]:
+                    if comp_of[y] == -1:
+                        comp_of[y] = c
+                        members.append(y)
+            members.sort()
+            components.append(members)
+        
+        # Aristas de cada componente con vértices renumerados
+        local = [0] * self.V
+        for members in components:
+            for i, x in enumerate(members):
+                local[x] = i
+        comp_edges: List[List[Tuple[int, int, float]]] = [[] for _ in components]
+        for u, v, w in self.edges:
+            comp_edges[comp_of[u]].append((local[u], local[v], w))
+        
+        results = [None] * len(components)
+        big = [c for c in range(len(components)) if len(comp_edges[c]) >= _FOREST_MIN_PARALLEL_EDGES]
+        pool = None
+        futures = {}
+        try:
+            if workers > 1 and big:
+                pool = ProcessPoolExecutor(min(workers, len(big)))
+                # Los más grandes primero para repartir mejor la carga
+                for c in sorted(big, key=lambda c: -len(comp_edges[c])):
+                    futures[c] = pool.submit(_component_mst, (len(components[c]), comp_edges[c]))
+            
+            for c in range(len(components)):
+                if c not in futures:
+                    results[c] = _component_mst((len(components[c]), comp_edges[c]))
+            for c, future in futures.items():
+                results[c] = future.result()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        
+        forest = []
+        for members, (edges, cost) in zip(components, results):
+            forest.append((members, [(members[u], members[v], w) for u, v, w in edges], cost))
+        return forest
+
+    # --- ALGORITMO DE BORŮVKA (PARALELO) ---
+    def boruvka_mst(self, workers: Optional[int] = None,
+                    verify: bool = False) -> Tuple[List[Tuple[int, int, float]], float]:
+        """
+        Encuentra el MST (o bosque) usando el algoritmo de Borůvka.
+        En cada ronda se busca la arista más barata que sale de cada
+        componente repartiendo las aristas entre procesos, que leen los
+        arreglos de aristas y de componentes desde memoria compartida; luego
+        se contraen los componentes. Hay a lo sumo log2(V) rondas.
+        
+        Args:
+            workers: Número de procesos (por defecto, número de CPUs).
+                     Con 1 o con pocas aristas se ejecuta en este proceso.
+            verify: Si se compara el costo obtenido con kruskal_mst
+            
+        Returns:
+            Tupla (lista de aristas del MST, costo total)
+            
+        Raises:
+            ValueError: Si verify es True y el costo no coincide con Kruskal
+        """
+        m = len(self.edges)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, m // _BORUVKA_MIN_CHUNK))
+        
+        mst_edges = []
+        mst_cost = 0
+        dsu = self.DSU(self.V)
+        
+        if m and self.V > 1:
+            local = {
+                'u': array('i', (u for u, _, _ in self.edges)),
+                'v': array('i', (v for _, v, _ in self.edges)),
+                'w': array('d', (w for _, _, w in self.edges)),
+                'comp': array('i', range(self.V)),
+            }
+            blocks = []
+            pool = None
+            try:
+                if workers > 1:
+                    # Copiar los arreglos a memoria compartida (sin serializar aristas por ronda)
+                    specs = {}
+                    arrays = {}
+                    for key, arr in local.items():
+                        shm = shared_memory.SharedMemory(create=True, size=len(arr) * arr.itemsize)
+                        view = shm.buf.cast(arr.typecode)
+                        view[:] = arr
+                        blocks.append((shm, view))
+                        specs[key] = (shm.name, arr.typecode)
+                        arrays[key] = view
+                    pool = ProcessPoolExecutor(workers, initializer=_boruvka_attach, initargs=(specs,))
+                    step = -(-m // workers)
+                    ranges = [(lo, min(lo + step, m)) for lo in range(0, m, step)]
+                else:
+                    arrays = local
+                
+                comp = arrays['comp']
+                while True:
+                    if pool is not None:
+                        partials = pool.map(_boruvka_worker, ranges)
+                    else:
+                        partials = [_cheapest_edges(arrays['u'], arrays['v'], arrays['w'], comp, 0, m)]
+                    
+                    # Combinar los mínimos parciales de cada componente
+                    best = {}
+                    for partial in partials:
+                        for c, cand in partial.items():
+                            if c not in best or cand < best[c]:
+                                best[c] = cand
+                    
+                    added = False
+                    for _, idx in best.values():
+                        u, v, w = self.edges[idx]
+                        if dsu.union(u, v):
+                            mst_edges.append((u, v, w))
+                            mst_cost += w
+                            added = True
+                    if not added:
+                        break
+                    
+                    # Contraer: cada vértice apunta al representante de su componente
+                    for vertex in range(self.V):
+                        comp[vertex] = dsu.find(vertex)
+            finally:
+                if pool is not None:
+                    pool.shutdown()
+                for shm, view in blocks:
+                    view.release()
+                    shm.close()
+                    shm.unlink()
+        
+        if verify:
+            _, expected = self.kruskal_mst()
+            if not math.isclose(mst_cost, expected, rel_tol=1e-9, abs_tol=1e-9):
+                raise ValueError(f"Costo de Borůvka ({mst_cost}) distinto al de Kruskal ({expected})")
+        
+        return mst_edges, mst_cost
+
+    # --- KRUSKAL EN MEMORIA EXTERNA ---
+    def external_kruskal_mst(self, file_path: str, run_size: int = 500000,
+                             tmp_dir: Optional[str] = None) -> Tuple[List[Tuple[int, int, float]], float]:
+        """
+        Encuentra el MST con Kruskal leyendo las aristas desde un archivo,
+        sin cargarlas en self.edges ni en self.adj.
+        Las aristas se ordenan en tramos de run_size que se vuelcan a archivos
+        temporales y luego se mezclan (k-way merge) hacia un DSU sobre los
+        vértices, así que la memoria pico depende de V y de run_size, no de E.
+        Los empates se resuelven por orden en el archivo, igual que kruskal_mst.
+        
+        Args:
+            file_path: Archivo de texto con una arista "u v peso" por línea
+                       (se ignoran líneas vacías y las que empiezan con #)
+            run_size: Aristas por tramo ordenado en memoria
+            tmp_dir: Directorio para los tramos temporales
+            
+        Returns:
+            Tupla (lista de aristas del MST, costo total)
+            
+        Raises:
+            ValueError: Si una línea está mal formada o usa un vértice inválido
+        """
+        if run_size < 1:
+            raise ValueError("run_size debe ser positivo")
+        
+        runs = []
+        try:
+            # Fase 1: tramos ordenados en disco
+            run = []
+            with open(file_path, 'r', encoding='utf-8') as f:
+                position = 0
+                for line_num, line in enumerate(f, 1):
+                    parts = line.split()
+                    if not parts or parts[0].startswith('#'):
+                        continue
+                    try:
+                        u, v, w = int(parts[0]), int(parts[1]), float(parts[2])
+                    except (IndexError, ValueError):
+                        raise ValueError(f"Línea {line_num} inválida: {line.strip()!r}")
+                    if not (0 <= u < self.V and 0 <= v < self.V):
+                        raise ValueError(f"Línea {line_num}: vértice fuera de rango 0..{self.V - 1}")
+                    
+                    run.append((w, position, u, v))
+                    position += 1
+                    if len(run) >= run_size:
+                        runs.append(self._spill_run(run, tmp_dir))
+                        run = []
+            if run:
+                runs.append(self._spill_run(run, tmp_dir))
+                run = []
+            
+            # Fase 2: mezcla de los tramos hacia el DSU
+            mst_cost = 0
+            mst_edges = []
+            dsu = self.DSU(self.V)
+            for w, _, u, v in heapq.merge(*(_read_run(f) for f in runs)):
+                if dsu.union(u, v):
+                    mst_edges.append((u, v, w))
+                    mst_cost += w
+                    if len(mst_edges) == self.V - 1:
+                        break
+        finally:
+            for f in runs:
+                f.close()  # Los temporales se borran al cerrarse
+        
+        return mst_edges, mst_cost
+
+    # --- ESCENARIOS DE FALLA (OFFLINE) ---
+    def failure_scenarios(self, scenarios: List[List[int]], center: int = 0,
+                          sensors: Optional[List[int]] = None,
+                          edges: Optional[List[Tuple[int, int, float]]] = None) -> List[List[int]]:
+        """
+        Responde, para varios escenarios de falla a la vez, qué sensores
+        pierden contacto con el centro de control.
+        Procesa los escenarios offline con divide y vencerás: cada arista se
+        agrega a un árbol de segmentos sobre los escenarios en los tramos en
+        que no falla, y un recorrido del árbol con un RollbackDSU une y
+        deshace aristas sin reconstruir la red por escenario. Las aristas que
+        nunca fallan se unen una sola vez.
+        
+        Args:
+            scenarios: Lista de escenarios; cada uno, índices de aristas caídas
+            center: Vértice del centro de control
+            sensors: Sensores a revisar (por defecto, todos los vértices)
+            edges: Red a evaluar (por defecto, self.edges; puede ser el MST)
+            
+        Returns:
+            Por escenario, lista de sensores desconectados del centro
+            
+        Raises:
+            ValueError: Si un escenario tiene un índice de arista fuera de rango
+        """
+        if edges is None:
+            edges = self.edges
+        if sensors is None:
+            sensors = list(range(self.V))
+        s = len(scenarios)
+        dsu = self.RollbackDSU(self.V)
+        
+        failing: Dict[int, List[int]] = {}
+        for k, failed in enumerate(scenarios):
+            for idx in set(failed):
+                if not 0 <= idx < len(edges):
+                    raise ValueError(f"Escenario {k}: arista {idx} fuera de rango 0..{len(edges) - 1}")
+                failing.setdefault(idx, []).append(k)
+        
+        for idx, (u, v, _) in enumerate(edges):
+            if idx not in failing:
+                dsu.union(u, v)
+        
+        # Árbol de segmentos sobre [0, s): aristas vigentes en cada tramo
+        tree: List[List[int]] = [[] for _ in range(4 * max(s, 1))]
+        
+        def insert(node, lo, hi, a, b, idx):
+            if b <= lo or hi <= a:
+                return
+            if a <= lo and hi <= b:
+                tree[node].append(idx)
+                return
+            mid = (lo + hi) // 2
+            insert(2 * node, lo, mid, a, b, idx)
+            insert(2 * node + 1, mid, hi, a, b, idx)
+        
+        for idx, down in failing.items():
+            start = 0
+            for k in down:  # Escenarios en orden creciente
+                if start < k:
+                    insert(1, 0, s, start, k, idx)
+                start = k + 1
+            if start < s:
+                insert(1, 0, s, start, s, idx)
+        
+        results: List[List[int]] = [[] for _ in range(s)]
+        
+        def solve(node, lo, hi):
+            mark = dsu.snapshot()
+            for idx in tree[node]:
+                u, v, _ = edges[idx]
+                dsu.union(u, v)
+            if hi - lo == 1:
+                root = dsu.find(center)
+                results[lo] = [x for x in sensors if dsu.find(x) != root]
+            else:
+                mid = (lo + hi) // 2
+                solve(2 * node, lo, mid)
+                solve(2 * node + 1, mid, hi)
+            dsu.rollback(mark)
+        
+        if s:
+            solve(1, 0, s)  # Profundidad log2(s): no hay riesgo de recursión
+        return results
+
+    @staticmethod
+    def _spill_run(run: List[Tuple[float, int, int, int]], tmp_dir: Optional[str]):
+        """Ordena un tramo de aristas y lo escribe en un archivo temporal."""
+        run.sort()
+        f = tempfile.TemporaryFile(dir=tmp_dir)
+        pack = _RUN_RECORD.pack
+        for i in range(0, len(run), _RUN_READ_RECORDS):
+            f.write(b''.join(pack(*rec) for rec in run[i:i + _RUN_READ_RECORDS]))
+        return f
+
 # Ejemplo de uso
 if __name__ == "__main__":
     g = GraphMST(4)
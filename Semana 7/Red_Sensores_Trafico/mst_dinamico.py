@@ -0,0 +1,375 @@
+import math
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+from mst import GraphMST
+
+
+class LinkCutTree:
+    """
+    Árbol link-cut (Sleator-Tarjan) con máximo de camino.
+    Cada nodo tiene una clave comparable; path_max devuelve el nodo de clave
+    máxima en el camino entre dos nodos. Todas las operaciones son
+    O(log n) amortizado.
+    """
+
+    def __init__(self):
+        self.left: List[int] = []
+        self.right: List[int] = []
+        self.parent: List[int] = []
+        self.rev: List[bool] = []
+        self.key: List[Tuple[float, int]] = []
+        self.best: List[int] = []  # Nodo de clave máxima en el subárbol del splay
+
+    def add_node(self, key: Tuple[float, int]) -> int:
+        """Agrega un nodo aislado y devuelve su índice."""
+        x = len(self.key)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.rev.append(False)
+        self.key.append(key)
+        self.best.append(x)
+        return x
+
+    def set_key(self, x: int, key: Tuple[float, int]):
+        """Cambia la clave de un nodo aislado (para reutilizarlo)."""
+        self.key[x] = key
+        self.best[x] = x
+
+    def _is_root(self, x: int) -> bool:
+        # Raíz de su árbol splay (su padre, si existe, es un path-parent)
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _pull(self, x: int):
+        key, best = self.key, self.best
+        b = x
+        child = self.left[x]
+        if child != -1 and key[best[child]] > key[b]:
+            b = best[child]
+        child = self.right[x]
+        if child != -1 and key[best[child]] > key[b]:
+            b = best[child]
+        best[x] = b
+
+    def _push(self, x: int):
+        if self.rev[x]:
+            l, r = self.left[x], self.right[x]
+            self.left[x], self.right[x] = r, l
+            if l != -1:
+                self.rev[l] = not self.rev[l]
+            if r != -1:
+                self.rev[r] = not self.rev[r]
+            self.rev[x] = False
+
+    def _rotate(self, x: int):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if left[p] == x:
+            b = right[x]
+            left[p] = b
+            right[x] = p
+        else:
+            b = left[x]
+            right[p] = b
+            left[x] = p
+        if b != -1:
+            parent[b] = p
+        if g != -1:
+            if left[g] == p:
+                left[g] = x
+            elif right[g] == p:
+                right[g] = x
+        parent[x] = g
+        parent[p] = x
+        self._pull(p)
+        self._pull(x)
+
+    def _splay(self, x: int):
+        # Propagar las inversiones pendientes desde la raíz del splay
+        path = [x]
+        y = x
+        while not self._is_root(y):
+            y = self.parent[y]
+            path.append(y)
+        for y in reversed(path):
+            self._push(y)
+
+        while not self._is_root(x):
+            p = self.parent[x]
+            if not self._is_root(p):
+                g = self.parent[p]
+                zig_zig = (self.left[p] == x) == (self.left[g] == p)
+                self._rotate(p if zig_zig else x)
+            self._rotate(x)
+
+    def _access(self, x: int):
+        last = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._pull(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def _make_root(self, x: int):
+        self._access(x)
+        self.rev[x] = not self.rev[x]
+
+    def find_root(self, x: int) -> int:
+        """Raíz del árbol que contiene a x."""
+        self._access(x)
+        while True:
+            self._push(x)
+            if self.left[x] == -1:
+                break
+            x = self.left[x]
+        self._splay(x)
+        return x
+
+    def connected(self, x: int, y: int) -> bool:
+        """Indica si x e y están en el mismo árbol."""
+        return x == y or self.find_root(x) == self.find_root(y)
+
+    def link(self, x: int, y: int):
+        """Une los árboles de x e y con la arista x-y (deben estar separados)."""
+        self._make_root(x)
+        self.parent[x] = y
+
+    def cut(self, x: int, y: int):
+        """Elimina la arista x-y del bosque."""
+        self._make_root(x)
+        self._access(y)
+        # Tras access(y), x es el único nodo a la izquierda de y
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._pull(y)
+
+    def path_max(self, x: int, y: int) -> int:
+        """Nodo de clave máxima en el camino x..y (deben estar conectados)."""
+        self._make_root(x)
+        self._access(y)
+        return self.best[y]
+
+
+class DynamicMST:
+    """
+    Árbol (bosque) de expansión mínima que se mantiene ante inserciones y
+    eliminaciones de aristas, sin recalcularlo desde cero.
+
+    - Insertar: si la arista cierra un ciclo, reemplaza a la más cara del
+      ciclo cuando es más barata (máximo de camino con un árbol link-cut).
+    - Eliminar una arista del árbol: busca la arista de reemplazo más barata
+      entre las no usadas que salen del lado más pequeño del corte.
+
+    Los empates se rompen por identificador de arista (orden de inserción),
+    igual que kruskal_mst, así que el árbol coincide arista por arista con
+    recalcularlo sobre las aristas vigentes.
+    """
+
+    def __init__(self, vertices: int):
+        """
+        Inicializa la estructura sin aristas.
+
+        Args:
+            vertices: Número de vértices (0 a vertices-1)
+        """
+        self.V = vertices
+        self.edges: Dict[int, Tuple[int, int, float]] = {}  # id -> (u, v, w)
+        self.tree: Set[int] = set()
+        self.cost = 0
+        self._next_id = 0
+        self._lct = LinkCutTree()
+        for _ in range(vertices):
+            self._lct.add_node((-math.inf, -1))  # Los vértices nunca son el máximo
+        self._edge_node: Dict[int, int] = {}  # id de arista del árbol -> nodo del LCT
+        self._free_nodes: List[int] = []
+        self._tree_adj: List[Set[int]] = [set() for _ in range(vertices)]
+        self._other_adj: List[Set[int]] = [set() for _ in range(vertices)]
+
+    @classmethod
+    def from_graph(cls, graph: GraphMST) -> 'DynamicMST':
+        """
+        Crea la estructura a partir de un GraphMST. Los identificadores de
+        arista son las posiciones en graph.edges.
+        """
+        dyn = cls(graph.V)
+        dsu = GraphMST.DSU(graph.V)
+        in_tree = [False] * len(graph.edges)
+        for idx in graph._sorted_edge_order():
+            u, v, _ = graph.edges[idx]
+            if dsu.union(u, v):
+                in_tree[idx] = True
+
+        for idx, (u, v, w) in enumerate(graph.edges):
+            dyn.edges[idx] = (u, v, w)
+            if in_tree[idx]:
+                dyn._add_tree_edge(idx)
+            elif u != v:
+                dyn._other_adj[u].add(idx)
+                dyn._other_adj[v].add(idx)
+        dyn._next_id = len(graph.edges)
+        return dyn
+
+    def insert_edge(self, u: int, v: int, w: float) -> int:
+        """
+        Agrega una arista y actualiza el MST.
+
+        Args:
+            u: Vértice origen
+            v: Vértice destino
+            w: Peso de la arista
+
+        Returns:
+            Identificador de la arista (para eliminarla después)
+
+        Raises:
+            ValueError: Si algún vértice está fuera de rango
+        """
+        if not (0 <= u < self.V and 0 <= v < self.V):
+            raise ValueError(f"Vértice fuera de rango 0..{self.V - 1}")
+
+        edge_id = self._next_id
+        self._next_id += 1
+        self.edges[edge_id] = (u, v, w)
+        if u == v:
+            return edge_id  # Un lazo nunca pertenece al árbol
+
+        if not self._lct.connected(u, v):
+            self._add_tree_edge(edge_id)
+            return edge_id
+
+        # Cierra un ciclo: comparar con la arista más cara del camino u..v
+        heaviest = self._lct.path_max(u, v)
+        old_w, old_id = self._lct.key[heaviest]
+        if (w, edge_id) < (old_w, old_id):
+            self._remove_tree_edge(old_id)
+            ou, ov, _ = self.edges[old_id]
+            self._other_adj[ou].add(old_id)
+            self._other_adj[ov].add(old_id)
+            self._add_tree_edge(edge_id)
+        else:
+            self._other_adj[u].add(edge_id)
+            self._other_adj[v].add(edge_id)
+        return edge_id
+
+    def delete_edge(self, edge_id: int):
+        """
+        Elimina una arista y actualiza el MST.
+
+        Args:
+            edge_id: Identificador devuelto por insert_edge (o posición en
+                     graph.edges si se creó con from_graph)
+
+        Raises:
+            KeyError: Si la arista no existe
+        """
+        u, v, _ = self.edges[edge_id]
+        if edge_id not in self.tree:
+            self._other_adj[u].discard(edge_id)
+            self._other_adj[v].discard(edge_id)
+            del self.edges[edge_id]
+            return
+
+        self._remove_tree_edge(edge_id)
+        del self.edges[edge_id]
+        replacement = self._find_replacement(u, v)
+        if replacement is not None:
+            ru, rv, _ = self.edges[replacement]
+            self._other_adj[ru].discard(replacement)
+            self._other_adj[rv].discard(replacement)
+            self._add_tree_edge(replacement)
+
+    def mst_edges(self) -> List[Tuple[int, int, float]]:
+        """Aristas actuales del MST, ordenadas por identificador."""
+        return [self.edges[i] for i in sorted(self.tree)]
+
+    def to_graph(self) -> GraphMST:
+        """GraphMST con las aristas vigentes en orden de identificador."""
+        g = GraphMST(self.V)
+        for i in sorted(self.edges):
+            g.add_edge(*self.edges[i])
+        return g
+
+    def _add_tree_edge(self, edge_id: int):
+        u, v, w = self.edges[edge_id]
+        key = (w, edge_id)
+        if self._free_nodes:
+            node = self._free_nodes.pop()
+            self._lct.set_key(node, key)
+        else:
+            node = self._lct.add_node(key)
+        self._lct.link(u, node)
+        self._lct.link(node, v)
+        self._edge_node[edge_id] = node
+        self._tree_adj[u].add(edge_id)
+        self._tree_adj[v].add(edge_id)
+        self.tree.add(edge_id)
+        self.cost += w
+
+    def _remove_tree_edge(self, edge_id: int):
+        u, v, w = self.edges[edge_id]
+        node = self._edge_node.pop(edge_id)
+        self._lct.cut(u, node)
+        self._lct.cut(node, v)
+        self._free_nodes.append(node)
+        self._tree_adj[u].discard(edge_id)
+        self._tree_adj[v].discard(edge_id)
+        self.tree.discard(edge_id)
+        self.cost -= w
+
+    def _find_replacement(self, a: int, b: int) -> Optional[int]:
+        """
+        Arista no usada más barata que reconecta los lados de a y b.
+        Recorre los dos lados en paralelo y se detiene con el primero que
+        se agota, así que el costo depende del lado más pequeño.
+        """
+        sides = [({a}, deque([a])), ({b}, deque([b]))]
+        small = None
+        while small is None:
+            for seen, queue in sides:
+                if not queue:
+                    small = seen
+                    break
+                x = queue.popleft()
+                for e in self._tree_adj[x]:
+                    eu, ev, _ = self.edges[e]
+                    y = ev if eu == x else eu
+                    if y not in seen:
+                        seen.add(y)
+                        queue.append(y)
+
+        best = None
+        best_key = None
+        for x in small:
+            for e in self._other_adj[x]:
+                eu, ev, w = self.edges[e]
+                if eu in small and ev in small:
+                    continue
+                if best_key is None or (w, e) < best_key:
+                    best_key = (w, e)
+                    best = e
+        return best
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    g = GraphMST(4)
+    g.add_edge(0, 1, 10)
+    g.add_edge(0, 2, 6)
+    g.add_edge(0, 3, 5)
+    g.add_edge(1, 3, 15)
+    g.add_edge(2, 3, 4)
+
+    dyn = DynamicMST.from_graph(g)
+    print(f"MST inicial: {dyn.mst_edges()} (costo {dyn.cost})")
+
+    new_id = dyn.insert_edge(1, 2, 3)
+    print(f"Tras insertar (1, 2, 3): {dyn.mst_edges()} (costo {dyn.cost})")
+
+    dyn.delete_edge(new_id)
+    print(f"Tras eliminarla: {dyn.mst_edges()} (costo {dyn.cost})")
@@ -0,0 +1,29 @@
+import pytest
+import math
+import random
+from indice_espacial import KDTree
+
+def test_kdtree_query_matches_brute_force():
+    """Test k vecinos más cercanos contra fuerza bruta."""
+    rng = random.Random(3)
+    pts = [(rng.random(), rng.random()) for _ in range(400)]
+    tree = KDTree(pts, leaf_size=4)
+
+    for i in range(0, 400, 23):
+        expected = sorted((math.dist(pts[i], pts[j]), j) for j in range(400) if j != i)[:5]
+        assert tree.query(pts[i], 5, skip=i) == expected
+
+def test_kdtree_nearest_other_label():
+    """Test vecino más cercano con etiqueta distinta."""
+    pts = [(0, 0), (1, 0), (5, 0), (9, 0)]
+    tree = KDTree(pts, leaf_size=1)
+    tree.label([0, 0, 1, 1])
+
+    assert tree.nearest_other(1) == (4.0, 2)
+    assert tree.nearest_other(3) == (8.0, 1)
+
+    tree.label([0, 0, 0, 0])
+    assert tree.nearest_other(0) is None
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,4 +1,7 @@
 import pytest
+import math
+import random
+import mst
 from mst import GraphMST
 
 def test_mst_simple_connected():
@@ -78,5 +81,274 @@ def test_mst_duplicate_weights():
     assert cost_prim == 3
     assert cost_kruskal == 3
 
+def random_graph(n, m, seed=0, max_w=100):
+    """Grafo aleatorio conexo: un camino base más m aristas extra."""
+    rng = random.Random(seed)
+    g = GraphMST(n)
+    for v in range(1, n):
+        g.add_edge(rng.randrange(v), v, rng.randint(1, max_w))
+    for _ in range(m):
+        u, v = rng.sample(range(n), 2)
+        g.add_edge(u, v, rng.randint(1, max_w))
+    return g
+
+@pytest.mark.parametrize("n, m", [(50, 40), (60, 1700), (200, 600)])
+def test_prim_variants_match_kruskal(n, m):
+    """Test Prim denso, con heap indexado y perezoso contra Kruskal."""
+    g = random_graph(n, m, seed=n)
+    _, expected = g.kruskal_mst()
+
+    for prim in (g.prim_mst, g.prim_mst_dense, g.prim_mst_heap, g.prim_mst_lazy):
+        edges, cost = prim(0)
+        assert cost == expected
+        assert len(edges) == n - 1
+
+def test_prim_variants_disconnected():
+    """Test Prim denso y con heap sólo cubren el componente inicial."""
+    g = GraphMST(5)
+    g.add_edge(0, 1, 5)
+    g.add_edge(1, 2, 1)
+    g.add_edge(3, 4, 10)
+
+    for prim in (g.prim_mst_dense, g.prim_mst_heap):
+        edges, cost = prim(0)
+        assert cost == 6
+        assert sorted(edges) == [(0, 1, 5), (1, 2, 1)]
+
+def test_dsu_long_chain_no_recursion():
+    """Test DSU iterativo sobre una cadena de padres muy larga."""
+    n = 200000
+    dsu = GraphMST.DSU(n)
+    for i in range(1, n):
+        dsu.parent[i] = i - 1  # Cadena degenerada 0 <- 1 <- ... <- n-1
+
+    assert dsu.find(n - 1) == 0
+    assert not dsu.union(0, n - 1)
+
+def test_kruskal_stops_after_tree_complete():
+    """Test Kruskal con aristas pesadas sobrantes tras completar el árbol."""
+    g = GraphMST(3)
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 2)
+    g.add_edge(0, 2, 50)
+    g.add_edge(2, 0, 70)
+
+    edges, cost = g.kruskal_mst()
+
+    assert edges == [(0, 1, 1), (1, 2, 2)]
+    assert cost == 3
+
+def test_boruvka_matches_kruskal():
+    """Test Borůvka secuencial: mismo costo que Kruskal, también en bosques."""
+    g = random_graph(300, 900, seed=5)
+    edges, cost = g.boruvka_mst(workers=1, verify=True)
+    assert len(edges) == 299
+
+    g = GraphMST(4)
+    g.add_edge(0, 1, 5)
+    g.add_edge(2, 3, 10)
+    assert g.boruvka_mst(workers=1)[1] == 15
+
+def test_boruvka_parallel(monkeypatch):
+    """Test Borůvka repartiendo las aristas entre procesos."""
+    monkeypatch.setattr(mst, "_BORUVKA_MIN_CHUNK", 100)
+    g = random_graph(500, 2000, seed=9, max_w=10)  # Muchos empates
+
+    edges, cost = g.boruvka_mst(workers=3, verify=True)
+
+    assert len(edges) == 499
+    assert cost == g.kruskal_mst()[1]
+
+@pytest.mark.parametrize("threshold", [1, 8, 1024])
+def test_filter_kruskal_matches_kruskal(threshold):
+    """Test Filter-Kruskal: mismas aristas que Kruskal, incluso con empates."""
+    g = random_graph(400, 6000, seed=threshold, max_w=20)
+
+    assert g.filter_kruskal_mst(threshold) == g.kruskal_mst()
+
+def test_filter_kruskal_disconnected():
+    """Test Filter-Kruskal en un bosque."""
+    g = GraphMST(4)
+    g.add_edge(0, 1, 5)
+    g.add_edge(2, 3, 10)
+    g.add_edge(1, 0, 7)
+
+    assert g.filter_kruskal_mst(threshold=1) == ([(0, 1, 5), (2, 3, 10)], 15)
+
+@pytest.mark.parametrize("threshold", [1, 1024])
+def test_filter_kruskal_equal_weights(threshold):
+    """Test Filter-Kruskal cuando todas las aristas pesan lo mismo."""
+    g = GraphMST(100)
+    for u in range(100):
+        for v in range(u + 1, 100):
+            g.add_edge(u, v, 1)
+
+    assert g.filter_kruskal_mst(threshold) == g.kruskal_mst()
+
+def _write_edge_file(path, edges):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("# u v peso\n")
+        for u, v, w in edges:
+            f.write(f"{u} {v} {w}\n")
+
+@pytest.mark.parametrize("run_size", [37, 500000])
+def test_external_kruskal_matches_kruskal(tmp_path, run_size):
+    """Test Kruskal externo: mismas aristas que Kruskal con varios tramos."""
+    g = random_graph(300, 2500, seed=4, max_w=15)
+    path = tmp_path / "aristas.txt"
+    _write_edge_file(path, g.edges)
+
+    result = GraphMST(300).external_kruskal_mst(str(path), run_size=run_size, tmp_dir=str(tmp_path))
+
+    assert result == g.kruskal_mst()
+    assert [p.name for p in tmp_path.iterdir()] == ["aristas.txt"]  # Tramos borrados
+
+def test_external_kruskal_invalid_line(tmp_path):
+    """Test Kruskal externo con un vértice fuera de rango."""
+    path = tmp_path / "aristas.txt"
+    _write_edge_file(path, [(0, 1, 3), (1, 9, 2)])
+
+    with pytest.raises(ValueError):
+        GraphMST(4).external_kruskal_mst(str(path))
+
+def _euclidean_complete(points):
+    g = GraphMST(len(points))
+    for u in range(len(points)):
+        for v in range(u + 1, len(points)):
+            g.add_edge(u, v, math.dist(points[u], points[v]))
+    return g
+
+def test_from_points_matches_complete_graph():
+    """Test MST euclidiano desde coordenadas contra el grafo completo."""
+    rng = random.Random(7)
+    points = [(rng.random(), rng.random()) for _ in range(250)]
+
+    g = GraphMST.from_points(points)
+    assert len(g.edges) < 250 * 8
+
+    edges, cost = g.kruskal_mst()
+    expected_edges, expected_cost = _euclidean_complete(points).kruskal_mst()
+    assert sorted(edges) == sorted(expected_edges)
+    assert math.isclose(cost, expected_cost)
+
+def test_from_points_connects_distant_clusters():
+    """Test grupos lejanos que los k vecinos no conectan por sí solos."""
+    rng = random.Random(8)
+    points = [(rng.gauss(c * 100, 1), rng.gauss(0, 1)) for c in range(3) for _ in range(30)]
+
+    edges, cost = GraphMST.from_points(points, k=4).kruskal_mst()
+
+    assert len(edges) == 89
+    assert math.isclose(cost, _euclidean_complete(points).kruskal_mst()[1])
+
+def test_rollback_dsu_undo():
+    """Test DSU con deshacer: rollback restaura el estado marcado."""
+    dsu = GraphMST.RollbackDSU(4)
+    dsu.union(0, 1)
+    mark = dsu.snapshot()
+    dsu.union(1, 2)
+    dsu.union(2, 3)
+    assert dsu.find(3) == dsu.find(0)
+
+    dsu.rollback(mark)
+
+    assert dsu.find(0) == dsu.find(1)
+    assert dsu.find(2) != dsu.find(0)
+    assert dsu.find(3) == 3
+
+def test_failure_scenarios_match_rebuild():
+    """Test escenarios de falla offline contra reconstruir la red en cada uno."""
+    rng = random.Random(11)
+    g = random_graph(60, 40, seed=11)
+    m = len(g.edges)
+    scenarios = [[rng.randrange(m) for _ in range(rng.randint(0, 6))] for _ in range(40)]
+
+    expected = []
+    for failed in scenarios:
+        dsu = GraphMST.DSU(60)
+        for idx, (u, v, _) in enumerate(g.edges):
+            if idx not in failed:
+                dsu.union(u, v)
+        expected.append([x for x in range(60) if dsu.find(x) != dsu.find(0)])
+
+    assert g.failure_scenarios(scenarios) == expected
+
+def test_failure_scenarios_on_mst():
+    """Test caída de una arista del MST: se pierde el subárbol."""
+    g = GraphMST(4)
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 1)
+    g.add_edge(2, 3, 1)
+    g.add_edge(0, 3, 9)
+    mst_edges, _ = g.kruskal_mst()
+
+    result = g.failure_scenarios([[1], [], [0, 2]], edges=mst_edges)
+
+    assert result == [[2, 3], [], [1, 2, 3]]
+
+def test_failure_scenarios_invalid_edge():
+    """Test índice de arista fuera de rango."""
+    g = GraphMST(3)
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 1)
+
+    with pytest.raises(ValueError):
+        g.failure_scenarios([[0], [2]])
+    with pytest.raises(ValueError):
+        g.failure_scenarios([[-1]])
+
+def _forest_graph():
+    """Tres componentes de tamaños muy distintos y un vértice aislado."""
+    g = GraphMST(400)
+    rng = random.Random(12)
+    for lo, hi, extra in [(0, 300, 900), (300, 350, 100), (350, 399, 60)]:
+        for v in range(lo + 1, hi):
+            g.add_edge(rng.randrange(lo, v), v, rng.randint(1, 50))
+        for _ in range(extra):
+            u, v = rng.sample(range(lo, hi), 2)
+            g.add_edge(u, v, rng.randint(1, 50))
+    return g
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_minimum_spanning_forest(monkeypatch, workers):
+    """Test bosque de expansión mínima: un árbol por componente."""
+    monkeypatch.setattr(mst, "_FOREST_MIN_PARALLEL_EDGES", 100)
+    g = _forest_graph()
+
+    forest = g.minimum_spanning_forest(workers=workers)
+
+    assert [members[0] for members, _, _ in forest] == [0, 300, 350, 399]
+    assert [len(edges) for _, edges, _ in forest] == [299, 49, 48, 0]
+    assert forest[3] == ([399], [], 0)
+    assert sum(cost for _, _, cost in forest) == g.kruskal_mst()[1]
+    for members, edges, _ in forest:
+        assert all(u in members and v in members for u, v, _ in edges)
+
+def test_single_linkage_clusters():
+    """Test agrupamiento: cortar las aristas más caras del MST."""
+    g = GraphMST(5)
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 2)
+    g.add_edge(3, 4, 1)
+    g.add_edge(2, 3, 10)
+
+    assert g.single_linkage_clusters(1) == [0, 0, 0, 0, 0]
+    assert g.single_linkage_clusters(2) == [0, 0, 0, 1, 1]
+    assert g.single_linkage_clusters(3) == [0, 0, 1, 2, 2]
+    with pytest.raises(ValueError):
+        g.single_linkage_clusters(0)
+
+def test_single_linkage_dendrogram_all_k():
+    """Test dendrograma: cualquier k coincide con el agrupamiento directo."""
+    g = random_graph(80, 150, seed=13, max_w=10)
+    g.add_edge(80 - 1, 80 - 1, 1)  # Un lazo no genera unión
+
+    dendrogram = g.single_linkage_dendrogram()
+
+    assert len(dendrogram) == 79
+    assert list(dendrogram.height) == sorted(dendrogram.height)
+    for k in range(1, 81):
+        assert dendrogram.labels(k) == g.single_linkage_clusters(k)
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
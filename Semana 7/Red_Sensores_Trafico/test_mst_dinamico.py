@@ -0,0 +1,67 @@
+import pytest
+import random
+from mst import GraphMST
+from mst_dinamico import DynamicMST, LinkCutTree
+
+def test_link_cut_path_max():
+    """Test árbol link-cut: conectividad y máximo de camino."""
+    lct = LinkCutTree()
+    for key in [(1, 0), (5, 1), (3, 2), (2, 3)]:
+        lct.add_node(key)
+    lct.link(0, 1)
+    lct.link(1, 2)
+    lct.link(3, 2)
+
+    assert lct.path_max(0, 3) == 1
+    assert lct.path_max(2, 3) == 2
+
+    lct.cut(1, 2)
+    assert not lct.connected(0, 3)
+    assert lct.connected(2, 3)
+
+def test_dynamic_mst_insert_replaces_cycle_max():
+    """Test inserción: la nueva arista reemplaza a la más cara del ciclo."""
+    g = GraphMST(3)
+    g.add_edge(0, 1, 10)
+    g.add_edge(1, 2, 20)
+    dyn = DynamicMST.from_graph(g)
+
+    dyn.insert_edge(0, 2, 5)
+
+    assert dyn.cost == 15
+    assert dyn.mst_edges() == [(0, 1, 10), (0, 2, 5)]
+
+@pytest.mark.parametrize("seed", range(8))
+def test_dynamic_mst_matches_recomputation(seed):
+    """Test secuencia aleatoria de altas y bajas contra Kruskal desde cero."""
+    rng = random.Random(seed)
+    n = 20
+    dyn = DynamicMST.from_graph(GraphMST(n))
+    live = []
+
+    for _ in range(300):
+        if live and rng.random() < 0.45:
+            dyn.delete_edge(live.pop(rng.randrange(len(live))))
+        else:
+            live.append(dyn.insert_edge(rng.randrange(n), rng.randrange(n), rng.randint(1, 6)))
+
+        edges, cost = dyn.to_graph().kruskal_mst()
+        assert sorted(dyn.mst_edges()) == sorted(edges)
+        assert dyn.cost == cost
+
+def test_dynamic_mst_delete_without_replacement():
+    """Test eliminar un puente deja un bosque."""
+    g = GraphMST(4)
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 2)
+    g.add_edge(2, 3, 3)
+    dyn = DynamicMST.from_graph(g)
+
+    dyn.delete_edge(1)
+
+    assert dyn.mst_edges() == [(0, 1, 1), (2, 3, 3)]
+    with pytest.raises(KeyError):
+        dyn.delete_edge(1)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])